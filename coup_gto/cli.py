@@ -1,28 +1,52 @@
 import argparse
+import functools
 import json
 import os
 import sys
-from datetime import datetime
+import time
 
-from coup_gto.solver import MCCFRSolver
-from coup_gto.engine import GameState
+# Structured log lines are batched and written with a single write() per flush
+_LOG_FLUSH_EVERY = 100
+# One shared compact encoder for structured log lines (no whitespace, like orjson)
+_dumps = json.JSONEncoder(separators=(",", ":")).encode
+# Static head of the train_progress event (matches _dumps output)
+_PROGRESS_PREFIX = '{"event":"train_progress","completed":'
+
+
+def _flush_log(buf: list) -> None:
+    if buf:
+        sys.stdout.write("".join(buf))
+        buf.clear()
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    # Single write() on a raw fd; no text wrapper or buffered writer for one small payload
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
 
 
 def _ensure_out_dir(out_dir: str) -> str:
     if not out_dir:
-        ts = datetime.now().strftime("%Y%m%d-%H%M%S")
+        ts = time.strftime("%Y%m%d-%H%M%S")
         out_dir = os.path.join("runs", ts)
     os.makedirs(out_dir, exist_ok=True)
     return out_dir
 
 
 def cmd_train(args: argparse.Namespace) -> int:
+    from coup_gto.solver import MCCFRSolver
+
     solver = MCCFRSolver(
         seed=args.seed,
         max_depth=args.max_depth,
         debug=args.debug,
         traversal_mode=args.traversal_mode,
         log_infoset_hash=args.log_infoset_hash,
+        regret_pruning=args.regret_pruning,
+        cfr_plus=args.cfr_plus,
     )
     out_dir = _ensure_out_dir(args.out)
 
@@ -35,33 +59,40 @@ def cmd_train(args: argparse.Namespace) -> int:
         "max_depth": args.max_depth,
         "traversal_mode": args.traversal_mode,
         "debug": args.debug,
+        "workers": args.workers,
+        "regret_pruning": args.regret_pruning,
+        "cfr_plus": args.cfr_plus,
     }
 
-    print(json.dumps({"event": "train_start", **meta}))
-
-    # Chunked training with progress logs
+    # Training with progress logs every log_interval iterations
     total = args.iterations
     interval = getattr(args, "log_interval", 0) or 0
-    if interval <= 0 or interval >= total:
-        solver.iterate(iterations=total, game_seed=args.game_seed)
-        print(json.dumps({"event": "train_progress", "completed": total, "total": total}))
-    else:
-        done = 0
-        while done < total:
-            step = min(interval, total - done)
-            solver.iterate(iterations=step, game_seed=args.game_seed)
-            done += step
-            print(json.dumps({"event": "train_progress", "completed": done, "total": total}))
-    print(json.dumps({"event": "train_end", **meta}))
-
-    # Simple checkpoint: just dump node count for now (placeholder for future strategy export)
-    ckpt_path = os.path.join(out_dir, "checkpoint.json")
+
+    log_buf: list = []
+    # Keep logs interleaved with solver debug prints when debugging
+    flush_every = 1 if args.debug else _LOG_FLUSH_EVERY
+
+    def log_progress(done: int) -> None:
+        log_buf.append(f'{_PROGRESS_PREFIX}{done},"total":{total}}}\n')
+        if len(log_buf) >= flush_every:
+            _flush_log(log_buf)
+
+    log_buf.append(_dumps({"event": "train_start", **meta}) + "\n")
+
+    solver.iterate_with_progress(total, interval, game_seed=args.game_seed, cb=log_progress, workers=args.workers)
+    log_buf.append(_dumps({"event": "train_end", **meta}) + "\n")
+    _flush_log(log_buf)
+
+    # Checkpoint the node tables in the binary format (save_checkpoint writes JSON for .json paths)
+    ckpt_path = os.path.join(out_dir, "checkpoint.bin")
     solver.save_checkpoint(ckpt_path)
     print(f"Saved checkpoint to {ckpt_path}")
     return 0
 
 
 def cmd_eval(args: argparse.Namespace) -> int:
+    from coup_gto.solver import MCCFRSolver
+
     solver = MCCFRSolver(
         seed=args.seed,
         max_depth=args.max_depth,
@@ -73,7 +104,7 @@ def cmd_eval(args: argparse.Namespace) -> int:
     if args.checkpoint:
         solver.load_checkpoint(args.checkpoint)
 
-    print(json.dumps({
+    print(_dumps({
         "event": "eval_start",
         "episodes": args.episodes,
         "seed": args.seed,
@@ -82,16 +113,19 @@ def cmd_eval(args: argparse.Namespace) -> int:
     }))
     val = solver.evaluate(episodes=args.episodes, seed=args.eval_seed)
     result = {"event": "eval_result", "avg_utility_p0": val}
-    print(json.dumps(result))
+    print(_dumps(result))
 
     if out_dir:
-        with open(os.path.join(out_dir, "eval.json"), "w", encoding="utf-8") as f:
-            json.dump(result, f)
+        _write_bytes(os.path.join(out_dir, "eval.json"), _dumps(result).encode("utf-8"))
         print(f"Saved eval to {out_dir}/eval.json")
     return 0
 
 
 def cmd_inspect(args: argparse.Namespace) -> int:
+    from coup_gto.engine import GameState
+    from coup_gto.engine.actions import ACTION_NAMES
+    from coup_gto.solver import MCCFRSolver
+
     solver = MCCFRSolver(
         seed=args.seed,
         max_depth=args.max_depth,
@@ -104,14 +138,16 @@ def cmd_inspect(args: argparse.Namespace) -> int:
     gs = GameState(num_players=2, seed=args.game_seed)
     acts = solver.action_probabilities(gs)
     data = [
-        {"action": a.type.name, "target": a.target, "prob": p}
+        {"action": ACTION_NAMES[a.type], "target": a.target, "prob": p}
         for a, p in acts
     ]
     print(json.dumps({"event": "inspect", "actions": data}, indent=2))
     return 0
 
 
+@functools.cache
 def build_parser() -> argparse.ArgumentParser:
+    # Built once per process; parse_args does not mutate the parser spec
     p = argparse.ArgumentParser(prog="coup_gto", description="Coup GTO MCCFR utilities")
     sub = p.add_subparsers(dest="cmd", required=True)
 
@@ -128,6 +164,9 @@ def build_parser() -> argparse.ArgumentParser:
     pt.add_argument("--game-seed", type=int, default=42)
     pt.add_argument("--out", type=str, default="")
     pt.add_argument("--log-interval", type=int, default=10, help="Emit a progress log every N iterations")
+    pt.add_argument("--workers", type=int, default=1, help="Worker processes for parallel iterations")
+    pt.add_argument("--regret-pruning", action="store_true", help="Skip strongly negative-regret actions in full traversal")
+    pt.add_argument("--cfr-plus", action="store_true", help="Floor regrets at 0 and use linear strategy averaging")
     pt.set_defaults(func=cmd_train)
 
     # eval
@@ -151,6 +190,10 @@ def main(argv: list[str] | None = None) -> int:
     argv = sys.argv[1:] if argv is None else argv
     parser = build_parser()
     args = parser.parse_args(argv)
+    if getattr(args, "regret_pruning", False) and args.traversal_mode != "full":
+        parser.error("--regret-pruning requires --traversal-mode full")
+    if getattr(args, "regret_pruning", False) and args.workers > 1:
+        parser.error("--regret-pruning is not supported with --workers > 1")
     return args.func(args)
 
 
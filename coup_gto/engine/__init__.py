@@ -1,10 +1,14 @@
-from .actions import Action, ActionType, Role
-from .state import GameState, PlayerState
+from .actions import Action, ActionType, Role, action_str, decode_action, encode_action
+from .state import GameState, PlayerState, UndoRecord
 
 __all__ = [
     "Action",
     "ActionType",
     "Role",
+    "action_str",
+    "decode_action",
+    "encode_action",
     "GameState",
     "PlayerState",
+    "UndoRecord",
 ]
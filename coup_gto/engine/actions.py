@@ -1,37 +1,52 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from enum import Enum, auto
-from typing import Optional
-
-
-class Role(Enum):
-    DUKE = "Duke"
-    ASSASSIN = "Assassin"
-    CAPTAIN = "Captain"
-    AMBASSADOR = "Ambassador"
-    CONTESSA = "Contessa"
-
-
-class ActionType(Enum):
-    INCOME = auto()
-    FOREIGN_AID = auto()
-    COUP = auto()
-    TAX = auto()
-    STEAL = auto()
-    ASSASSINATE = auto()
-    EXCHANGE = auto()
+from enum import IntEnum
+from typing import Dict, NamedTuple, Optional, Tuple
+
+
+class Role(IntEnum):
+    DUKE = 0
+    ASSASSIN = 1
+    CAPTAIN = 2
+    AMBASSADOR = 3
+    CONTESSA = 4
+
+    # IntEnum would print the bare value on 3.11+; keep the readable name in str()/f-strings
+    def __str__(self) -> str:
+        return ROLE_NAMES[self]
+
+    def __format__(self, spec: str) -> str:
+        return format(ROLE_NAMES[self], spec)
+
+
+# Display names, indexed by Role value
+ROLE_NAMES: Tuple[str, ...] = ("Duke", "Assassin", "Captain", "Ambassador", "Contessa")
+
+
+class ActionType(IntEnum):
+    INCOME = 0
+    FOREIGN_AID = 1
+    COUP = 2
+    TAX = 3
+    STEAL = 4
+    ASSASSINATE = 5
+    EXCHANGE = 6
     # Interaction/response actions
-    PASS = auto()
-    BLOCK_FOREIGN_AID = auto()
-    BLOCK_ASSASSINATE = auto()
-    BLOCK_STEAL_CAPTAIN = auto()
-    BLOCK_STEAL_AMBASSADOR = auto()
-    CHALLENGE = auto()
+    PASS = 7
+    BLOCK_FOREIGN_AID = 8
+    BLOCK_ASSASSINATE = 9
+    BLOCK_STEAL_CAPTAIN = 10
+    BLOCK_STEAL_AMBASSADOR = 11
+    CHALLENGE = 12
+
+    def __str__(self) -> str:
+        return ACTION_NAMES[self]
+
+    def __format__(self, spec: str) -> str:
+        return format(ACTION_NAMES[self], spec)
 
 
-@dataclass(frozen=True)
-class Action:
+class Action(NamedTuple):
     actor: int
     type: ActionType
     target: Optional[int] = None
@@ -39,6 +54,82 @@ class Action:
     cost: int = 0  # paid from actor when applying; set by rules/state for convenience
 
     def __str__(self) -> str:
+        # Interned name lookup; avoids the Enum.name descriptor on every trace line
+        name = ACTION_NAMES[self.type]
         if self.target is None:
-            return f"P{self.actor}:{self.type.name}"
-        return f"P{self.actor}:{self.type.name}->P{self.target}"
+            return f"P{self.actor}:{name}"
+        return f"P{self.actor}:{name}->P{self.target}"
+
+
+MAX_PLAYERS = 6
+NUM_ACTION_IDS = len(ActionType) * (MAX_PLAYERS + 1)
+
+# Interned enum names, indexed by ActionType value
+ACTION_NAMES: Tuple[str, ...] = tuple(t.name for t in ActionType)
+
+# Canonical Action instances for every (actor, type, target); legal-action generators
+# hand these out instead of constructing a fresh Action per call.
+ACTION_TEMPLATES: Dict[Tuple[int, ActionType, Optional[int]], Action] = {
+    (actor, at, tgt): Action(actor=actor, type=at, target=tgt)
+    for actor in range(MAX_PLAYERS)
+    for at in ActionType
+    for tgt in (None, *range(MAX_PLAYERS))
+}
+
+
+# Dense id per (type, target) in range(NUM_ACTION_IDS), computed once; the actor is not included
+ACTION_IDS: Dict[Tuple[ActionType, Optional[int]], int] = {
+    (at, tgt): at * (MAX_PLAYERS + 1) + (0 if tgt is None else tgt + 1)
+    for at in ActionType
+    for tgt in (None, *range(MAX_PLAYERS))
+}
+
+
+# Packed uint32 layout: actor:4 | type:8 | target:4 | cost:8
+ACTOR_SHIFT = 0
+TYPE_SHIFT = 4
+TARGET_SHIFT = 12
+COST_SHIFT = 16
+
+_ACTOR_MASK = 0xF
+_TYPE_MASK = 0xFF
+_TARGET_MASK = 0xF
+_COST_MASK = 0xFF
+_NO_TARGET = _TARGET_MASK  # sentinel for target=None (player ids are < 15)
+
+
+def encode_action(actor: int, type_: int, target: Optional[int] = None, cost: int = 0) -> int:
+    tgt = _NO_TARGET if target is None else target
+    return (
+        (actor << ACTOR_SHIFT)
+        | (type_ << TYPE_SHIFT)
+        | (tgt << TARGET_SHIFT)
+        | (cost << COST_SHIFT)
+    )
+
+
+def decode_action(code: int) -> Action:
+    # Zero-cost codes (everything legal_actions() hands out) decode to the interned template
+    action = _DECODED.get(code)
+    if action is not None:
+        return action
+    tgt = (code >> TARGET_SHIFT) & _TARGET_MASK
+    return Action(
+        actor=(code >> ACTOR_SHIFT) & _ACTOR_MASK,
+        type=ActionType((code >> TYPE_SHIFT) & _TYPE_MASK),
+        target=None if tgt == _NO_TARGET else tgt,
+        cost=(code >> COST_SHIFT) & _COST_MASK,
+    )
+
+
+_DECODED: Dict[int, Action] = {encode_action(*a): a for a in ACTION_TEMPLATES.values()}
+
+
+def action_str(code: int) -> str:
+    # Same format as Action.__str__, read straight from the packed int
+    actor = (code >> ACTOR_SHIFT) & _ACTOR_MASK
+    name = ACTION_NAMES[(code >> TYPE_SHIFT) & _TYPE_MASK]
+    tgt = (code >> TARGET_SHIFT) & _TARGET_MASK
+    if tgt == _NO_TARGET:
+        return f"P{actor}:{name}"
+    return f"P{actor}:{name}->P{tgt}"
@@ -1,24 +1,82 @@
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 import random
 
-from coup_gto.engine.actions import Action, ActionType, Role
+from coup_gto.engine.actions import ACTION_TEMPLATES, MAX_PLAYERS, ROLE_NAMES, Action, ActionType, Role
+from coup_gto.engine.zobrist import COIN_BUCKETS, key_stream
 from coup_gto.rules.base import BaseRules
 
 
-@dataclass
+# Memoized legal action sets, keyed by the state fields legal_actions() depends on
+_LEGAL_CACHE: Dict[tuple, Tuple[Action, ...]] = {}
+
+# Response types per pending action type: (awaited opponent's options before any block,
+# original actor's options once a block is declared; None if the action cannot be blocked)
+_RESPONSE_TYPES: Dict[ActionType, Tuple[Tuple[ActionType, ...], Optional[Tuple[ActionType, ...]]]] = {
+    ActionType.FOREIGN_AID: (
+        (ActionType.PASS, ActionType.BLOCK_FOREIGN_AID),
+        (ActionType.CHALLENGE, ActionType.PASS),
+    ),
+    ActionType.TAX: ((ActionType.CHALLENGE, ActionType.PASS), None),
+    ActionType.EXCHANGE: ((ActionType.CHALLENGE, ActionType.PASS), None),
+    ActionType.STEAL: (
+        (ActionType.PASS, ActionType.BLOCK_STEAL_CAPTAIN, ActionType.BLOCK_STEAL_AMBASSADOR, ActionType.CHALLENGE),
+        (ActionType.CHALLENGE, ActionType.PASS),
+    ),
+    ActionType.ASSASSINATE: (
+        (ActionType.PASS, ActionType.BLOCK_ASSASSINATE, ActionType.CHALLENGE),
+        (ActionType.CHALLENGE, ActionType.PASS),
+    ),
+}
+
+
+# Zobrist keys for GameState.zobrist(), drawn from a fixed seed so keys are stable across processes
+_Z_ROLES = len(Role)
+_Z_SLOTS = 4  # hand/revealed positions per player
+_Z_COINS = COIN_BUCKETS
+_Z_DECK = 64  # deck positions
+_z_keys = key_stream(0x2B1D)
+
+_Z_CURRENT = _z_keys(MAX_PLAYERS)
+_Z_COIN = _z_keys(MAX_PLAYERS * _Z_COINS)
+_Z_HAND = _z_keys(MAX_PLAYERS * _Z_SLOTS * _Z_ROLES)
+_Z_REVEALED = _z_keys(MAX_PLAYERS * _Z_SLOTS * _Z_ROLES)
+_Z_DECK_CARD = _z_keys(_Z_DECK * _Z_ROLES)
+# Pending action indexed by (type, actor, target + 1); the other pending fields by value + 1
+_Z_PENDING = _z_keys(len(ActionType) * MAX_PLAYERS * (MAX_PLAYERS + 1))
+_Z_BLOCKER = _z_keys(MAX_PLAYERS + 1)
+_Z_BLOCK_ROLE = _z_keys(_Z_ROLES + 1)
+_Z_AWAITING = _z_keys(MAX_PLAYERS + 1)
+_Z_CLAIM_ROLE = _z_keys(_Z_ROLES + 1)
+
+@dataclass(slots=True)
 class PlayerState:
     coins: int
     hand: List[Role] = field(default_factory=list)
     revealed: List[Role] = field(default_factory=list)
 
     def alive(self) -> bool:
-        return len(self.hand) > 0
+        return bool(self.hand)
 
+    def has(self, role: Role) -> bool:
+        return role in self.hand
 
-@dataclass
+
+@dataclass(slots=True)
+class UndoRecord:
+    # Prior values needed to reverse one apply(); cards/deck are captured on first touch only
+    current_player: int
+    coins: Tuple[int, ...]
+    pending: tuple  # (pending_action, pending_blocker, pending_block_role, awaiting_response_from, pending_claim_role)
+    cards: Dict[int, Tuple[Tuple[Role, ...], Tuple[Role, ...]]] = field(default_factory=dict)
+    deck: Optional[Tuple[Role, ...]] = None
+    rng_state: Optional[tuple] = None
+
+
+@dataclass(slots=True)
 class GameState:
     num_players: int
     rules: BaseRules = field(default_factory=BaseRules)
@@ -37,18 +95,23 @@ class GameState:
     awaiting_response_from: Optional[int] = field(init=False, default=None)
     # If a claim is being challenged (unblocked actions like TAX), track the claimed role
     pending_claim_role: Optional[Role] = field(init=False, default=None)
+    # Undo record being filled by apply_reversible(), if any
+    _journal: Optional[UndoRecord] = field(init=False, default=None, repr=False, compare=False)
 
     def __init__(self, num_players: int, seed: Optional[int] = 0, rules: Optional[BaseRules] = None):
         assert 2 <= num_players <= 6, "Coup supports 2-6 players"
         self.num_players = num_players
         self.rules = rules or BaseRules()
         self.rng = random.Random(seed)
+        # Slotted instances get no class-level defaults; start with no pending interaction
+        self._clear_pending()
+        self._journal = None
         self._setup()
 
     # --- Setup ---
     def _setup(self) -> None:
         self.players = [PlayerState(coins=self.rules.starting_coins) for _ in range(self.num_players)]
-        self.deck = self.rules.full_deck()[:]
+        self.deck = self.rules.full_deck()
         self.rng.shuffle(self.deck)
         # deal cards
         for _ in range(self.rules.cards_per_player):
@@ -68,10 +131,14 @@ class GameState:
         self.current_player = nxt
 
     def winner(self) -> Optional[int]:
-        alive = self.alive_players()
-        if len(alive) == 1:
-            return alive[0]
-        return None
+        # Checked after every ply: scan without building a list and stop at the second survivor
+        found: Optional[int] = None
+        for i, ps in enumerate(self.players):
+            if ps.hand:
+                if found is not None:
+                    return None
+                found = i
+        return found
 
     # --- Cloning ---
     def clone(self) -> "GameState":
@@ -86,62 +153,209 @@ class GameState:
         ]
         gs.deck = list(self.deck)
         gs.current_player = self.current_player
-        # Initialize with a fixed seed to avoid OS entropy calls during frequent clones,
-        # then restore the exact RNG state from the source GameState.
-        saved_state = self.rng.getstate()
-        gs.rng = random.Random(0)
-        gs.rng.setstate(saved_state)
+        # Allocate the RNG without seeding it at all (no OS entropy, no throwaway seed)
+        # and restore the exact RNG state from the source GameState.
+        gs.rng = random.Random.__new__(random.Random)
+        gs.rng.setstate(self.rng.getstate())
 
         # Pending interaction fields
-        gs.pending_action = (
-            None
-            if self.pending_action is None
-            else Action(actor=self.pending_action.actor, type=self.pending_action.type, target=self.pending_action.target)
-        )
+        # Actions are immutable tuples, safe to share between clones
+        gs.pending_action = self.pending_action
         gs.pending_blocker = self.pending_blocker
         gs.pending_block_role = self.pending_block_role
         gs.awaiting_response_from = self.awaiting_response_from
         gs.pending_claim_role = self.pending_claim_role
+        gs._journal = None
         return gs
 
+    # --- Hashing ---
+    def zobrist(self) -> int:
+        # 64-bit key over everything apply() can change except the RNG state, for
+        # transposition tables; clones and restored snapshots of a state share its key.
+        # Coin counts of _Z_COINS - 1 and up share one bucket, so states differing only
+        # there collide (unreachable in play: the mandatory coup caps a purse at 12).
+        # GameState stays unhashable since it is mutable; key tables on this value instead.
+        h = _Z_CURRENT[self.current_player]
+        for pid, ps in enumerate(self.players):
+            h ^= _Z_COIN[pid * _Z_COINS + min(ps.coins, _Z_COINS - 1)]
+            base = pid * _Z_SLOTS * _Z_ROLES
+            for i, r in enumerate(ps.hand):
+                h ^= _Z_HAND[base + i * _Z_ROLES + r]
+            for i, r in enumerate(ps.revealed):
+                h ^= _Z_REVEALED[base + i * _Z_ROLES + r]
+        for i, r in enumerate(self.deck):
+            h ^= _Z_DECK_CARD[i * _Z_ROLES + r]
+        pa = self.pending_action
+        if pa is not None:
+            tgt = 0 if pa.target is None else pa.target + 1
+            h ^= _Z_PENDING[(pa.type * MAX_PLAYERS + pa.actor) * (MAX_PLAYERS + 1) + tgt]
+        if self.pending_blocker is not None:
+            h ^= _Z_BLOCKER[self.pending_blocker + 1]
+        if self.pending_block_role is not None:
+            h ^= _Z_BLOCK_ROLE[self.pending_block_role + 1]
+        if self.awaiting_response_from is not None:
+            h ^= _Z_AWAITING[self.awaiting_response_from + 1]
+        if self.pending_claim_role is not None:
+            h ^= _Z_CLAIM_ROLE[self.pending_claim_role + 1]
+        return h
+
+    # --- Snapshots ---
+    def snapshot(self) -> tuple:
+        # Flat tuple of primitives capturing everything apply() can mutate; pair with
+        # restore() to explore a line in place instead of cloning per node.
+        return (
+            tuple((p.coins, tuple(p.hand), tuple(p.revealed)) for p in self.players),
+            tuple(self.deck),
+            self.current_player,
+            self.rng.getstate(),
+            self.pending_action,
+            self.pending_blocker,
+            self.pending_block_role,
+            self.awaiting_response_from,
+            self.pending_claim_role,
+        )
+
+    def restore(self, snap: tuple) -> None:
+        # Write a snapshot() back in place, reusing the existing player and deck lists
+        (
+            players,
+            deck,
+            self.current_player,
+            rng_state,
+            self.pending_action,
+            self.pending_blocker,
+            self.pending_block_role,
+            self.awaiting_response_from,
+            self.pending_claim_role,
+        ) = snap
+        for ps, (coins, hand, revealed) in zip(self.players, players):
+            ps.coins = coins
+            ps.hand[:] = hand
+            ps.revealed[:] = revealed
+        self.deck[:] = deck
+        self.rng.setstate(rng_state)
+
+    # --- Reversible application ---
+    def apply_reversible(self, action: Action) -> UndoRecord:
+        # apply_unchecked() while journaling prior values; undo(record) reverses it in place
+        rec = UndoRecord(
+            current_player=self.current_player,
+            coins=tuple(p.coins for p in self.players),
+            pending=(
+                self.pending_action,
+                self.pending_blocker,
+                self.pending_block_role,
+                self.awaiting_response_from,
+                self.pending_claim_role,
+            ),
+        )
+        self._journal = rec
+        try:
+            self.apply_unchecked(action)
+        finally:
+            self._journal = None
+        return rec
+
+    def undo(self, rec: UndoRecord) -> None:
+        # Records must be undone in LIFO order
+        self.current_player = rec.current_player
+        for ps, coins in zip(self.players, rec.coins):
+            ps.coins = coins
+        (
+            self.pending_action,
+            self.pending_blocker,
+            self.pending_block_role,
+            self.awaiting_response_from,
+            self.pending_claim_role,
+        ) = rec.pending
+        for pid, (hand, revealed) in rec.cards.items():
+            ps = self.players[pid]
+            ps.hand[:] = hand
+            ps.revealed[:] = revealed
+        if rec.deck is not None:
+            self.deck[:] = rec.deck
+        if rec.rng_state is not None:
+            self.rng.setstate(rec.rng_state)
+
+    def _touch_cards(self, pid: int) -> None:
+        # Journal a player's hand/revealed before the first mutation under apply_reversible
+        j = self._journal
+        if j is not None and pid not in j.cards:
+            ps = self.players[pid]
+            j.cards[pid] = (tuple(ps.hand), tuple(ps.revealed))
+
+    def _touch_deck(self, shuffles: bool) -> None:
+        # Journal the deck (and RNG state, if about to shuffle) before the first mutation
+        j = self._journal
+        if j is None:
+            return
+        if j.deck is None:
+            j.deck = tuple(self.deck)
+        if shuffles and j.rng_state is None:
+            j.rng_state = self.rng.getstate()
+
     # --- Actions ---
-    def legal_actions(self) -> List[Action]:
+    def legal_actions(self) -> Tuple[Action, ...]:
         if self.winner() is not None:
-            return []
-        # If an interaction is pending, return response options
-        if self.pending_action is not None:
-            return self._legal_responses()
-
+            return ()
+        # Legal sets depend only on a few fields, so they are memoized (module-wide, rules
+        # independent) on a signature of exactly those fields and returned as shared tuples.
+        pa = self.pending_action
+        if pa is not None:
+            # If an interaction is pending, return response options; they depend only on the
+            # pending type/actor and phase, not on the pending action's target or cost
+            key = (pa.type, pa.actor, self.pending_blocker is None, self.awaiting_response_from)
+        else:
+            coins = self.players[self.current_player].coins
+            rules = self.rules
+            target = self._default_target()
+            key = (
+                self.current_player,
+                target,
+                coins >= rules.mandatory_coup_threshold,
+                coins >= rules.assassinate_cost,
+                coins >= rules.coup_cost,
+            )
+        legal = _LEGAL_CACHE.get(key)
+        if legal is None:
+            legal = tuple(self._legal_responses() if pa is not None else self._legal_turn_actions(target))
+            _LEGAL_CACHE[key] = legal
+        return legal
+
+    def _legal_turn_actions(self, target: Optional[int]) -> List[Action]:
         actor = self.current_player
         ps = self.players[actor]
 
         # If at or above mandatory coup threshold, only coup is legal
         if ps.coins >= self.rules.mandatory_coup_threshold:
-            return [Action(actor=actor, type=ActionType.COUP, target=self._default_target())]
+            return [ACTION_TEMPLATES[actor, ActionType.COUP, target]]
 
         actions: List[Action] = []
         # Income
-        actions.append(Action(actor=actor, type=ActionType.INCOME))
+        actions.append(ACTION_TEMPLATES[actor, ActionType.INCOME, None])
         # Foreign Aid (block/challenge handled via pending interaction)
-        actions.append(Action(actor=actor, type=ActionType.FOREIGN_AID))
+        actions.append(ACTION_TEMPLATES[actor, ActionType.FOREIGN_AID, None])
         # Duke Tax (challengeable claim)
-        actions.append(Action(actor=actor, type=ActionType.TAX))
+        actions.append(ACTION_TEMPLATES[actor, ActionType.TAX, None])
         # Ambassador Exchange (challengeable claim)
-        actions.append(Action(actor=actor, type=ActionType.EXCHANGE))
+        actions.append(ACTION_TEMPLATES[actor, ActionType.EXCHANGE, None])
         # Captain Steal (challengeable, blockable by Captain or Ambassador)
-        if actor != self._default_target():
-            actions.append(Action(actor=actor, type=ActionType.STEAL, target=self._default_target()))
+        if actor != target:
+            actions.append(ACTION_TEMPLATES[actor, ActionType.STEAL, target])
         # Assassin Assassinate (challengeable and blockable by Contessa)
         if ps.coins >= self.rules.assassinate_cost:
-            actions.append(Action(actor=actor, type=ActionType.ASSASSINATE, target=self._default_target()))
+            actions.append(ACTION_TEMPLATES[actor, ActionType.ASSASSINATE, target])
         # Coup if enough coins
         if ps.coins >= self.rules.coup_cost:
-            actions.append(Action(actor=actor, type=ActionType.COUP, target=self._default_target()))
+            actions.append(ACTION_TEMPLATES[actor, ActionType.COUP, target])
         # Placeholder: claimed actions to be added later
         return actions
 
     def _default_target(self) -> Optional[int]:
         # For 2 players, the only target is the opponent. For N>2, choose the next alive opponent by default
+        if self.num_players == 2:
+            opp = 1 - self.current_player
+            return opp if self.players[opp].hand else None
         for offset in range(1, self.num_players):
             cand = (self.current_player + offset) % self.num_players
             if self.players[cand].alive():
@@ -150,39 +364,15 @@ class GameState:
 
     def apply(self, action: Action) -> None:
         # If in a response window, the responder may not be the current_player
-        legal = self.legal_actions()
-        assert action in self._as_set(legal), f"Illegal action: {action}"
+        assert action in self.legal_actions(), f"Illegal action: {action}"
         if self.pending_action is None:
             assert action.actor == self.current_player, "Not this player's turn"
+        self.apply_unchecked(action)
 
-        if action.type == ActionType.INCOME:
-            self._apply_income(action)
-        elif action.type == ActionType.FOREIGN_AID:
-            self._start_foreign_aid_interaction(action)
-        elif action.type == ActionType.COUP:
-            self._apply_coup(action)
-        elif action.type == ActionType.PASS:
-            self._apply_pass(action)
-        elif action.type == ActionType.BLOCK_FOREIGN_AID:
-            self._apply_block_foreign_aid(action)
-        elif action.type == ActionType.BLOCK_ASSASSINATE:
-            self._apply_block_assassinate(action)
-        elif action.type == ActionType.BLOCK_STEAL_CAPTAIN:
-            self._apply_block_steal_captain(action)
-        elif action.type == ActionType.BLOCK_STEAL_AMBASSADOR:
-            self._apply_block_steal_ambassador(action)
-        elif action.type == ActionType.CHALLENGE:
-            self._apply_challenge(action)
-        elif action.type == ActionType.TAX:
-            self._start_tax_interaction(action)
-        elif action.type == ActionType.EXCHANGE:
-            self._start_exchange_interaction(action)
-        elif action.type == ActionType.STEAL:
-            self._start_steal_interaction(action)
-        elif action.type == ActionType.ASSASSINATE:
-            self._start_assassinate_interaction(action)
-        else:
-            raise NotImplementedError(f"Action not yet implemented: {action.type}")
+    def apply_unchecked(self, action: Action) -> None:
+        # apply() without legality checks, for trusted callers (search/self-play) that pick
+        # the action from legal_actions() themselves
+        _APPLY_HANDLERS[action.type](self, action)
 
         # advance turn if game not over
         if self.winner() is None and self.pending_action is None and self.awaiting_response_from is None:
@@ -199,61 +389,22 @@ class GameState:
         self.awaiting_response_from = self._default_target()
 
     def _legal_responses(self) -> List[Action]:
-        assert self.pending_action is not None
-        acts: List[Action] = []
-        # Foreign Aid response window
-        if self.pending_action.type == ActionType.FOREIGN_AID:
-            if self.pending_blocker is None:
-                # The opponent can pass or declare a block with Duke
-                responder = self.awaiting_response_from
-                assert responder is not None
-                acts.append(Action(actor=responder, type=ActionType.PASS))
-                acts.append(Action(actor=responder, type=ActionType.BLOCK_FOREIGN_AID))
-            else:
-                # A block was declared; the original actor may challenge or pass (accept block)
-                actor = self.pending_action.actor
-                acts.append(Action(actor=actor, type=ActionType.CHALLENGE))
-                acts.append(Action(actor=actor, type=ActionType.PASS))
-        # Tax response window (opponent can challenge or pass)
-        elif self.pending_action.type == ActionType.TAX:
-            responder = self.awaiting_response_from
-            assert responder is not None
-            acts.append(Action(actor=responder, type=ActionType.CHALLENGE))
-            acts.append(Action(actor=responder, type=ActionType.PASS))
-        # Exchange response window
-        elif self.pending_action.type == ActionType.EXCHANGE:
+        pa = self.pending_action
+        assert pa is not None
+        options = _RESPONSE_TYPES.get(pa.type)
+        if options is None:
+            return []
+        unblocked, blocked = options
+        if self.pending_blocker is None or blocked is None:
+            # Before any block, the awaited opponent responds
             responder = self.awaiting_response_from
             assert responder is not None
-            acts.append(Action(actor=responder, type=ActionType.CHALLENGE))
-            acts.append(Action(actor=responder, type=ActionType.PASS))
-        # Steal response window
-        elif self.pending_action.type == ActionType.STEAL:
-            if self.pending_blocker is None:
-                responder = self.awaiting_response_from
-                assert responder is not None
-                acts.append(Action(actor=responder, type=ActionType.PASS))
-                acts.append(Action(actor=responder, type=ActionType.BLOCK_STEAL_CAPTAIN))
-                acts.append(Action(actor=responder, type=ActionType.BLOCK_STEAL_AMBASSADOR))
-                acts.append(Action(actor=responder, type=ActionType.CHALLENGE))
-            else:
-                actor = self.pending_action.actor
-                acts.append(Action(actor=actor, type=ActionType.CHALLENGE))
-                acts.append(Action(actor=actor, type=ActionType.PASS))
-        # Assassinate response window
-        elif self.pending_action.type == ActionType.ASSASSINATE:
-            if self.pending_blocker is None:
-                # Target may pass (accept), block (Contessa), or challenge the claim
-                responder = self.awaiting_response_from
-                assert responder is not None
-                acts.append(Action(actor=responder, type=ActionType.PASS))
-                acts.append(Action(actor=responder, type=ActionType.BLOCK_ASSASSINATE))
-                acts.append(Action(actor=responder, type=ActionType.CHALLENGE))
-            else:
-                # Block declared; actor may challenge or pass (accept block)
-                actor = self.pending_action.actor
-                acts.append(Action(actor=actor, type=ActionType.CHALLENGE))
-                acts.append(Action(actor=actor, type=ActionType.PASS))
-        return acts
+            types = unblocked
+        else:
+            # A block was declared; the original actor may challenge or pass (accept block)
+            responder = pa.actor
+            types = blocked
+        return [ACTION_TEMPLATES[responder, t, None] for t in types]
 
     def _apply_pass(self, action: Action) -> None:
         # Handle passes depending on the interaction stage
@@ -326,117 +477,98 @@ class GameState:
         self.awaiting_response_from = self.pending_action.actor
 
     def _apply_challenge(self, action: Action) -> None:
-        assert self.pending_action is not None
-        if self.pending_action.type == ActionType.FOREIGN_AID:
-            assert self.pending_blocker is not None and self.pending_block_role == Role.DUKE
-            challenger = action.actor
-            blocker = self.pending_blocker
-            # Resolve challenge to block
-            if self._player_has_role(blocker, Role.DUKE):
-                # Blocker truthful
-                self._truthful_reveal(blocker, Role.DUKE)
-                self._lose_influence(challenger)
-                self._clear_pending()
-            else:
-                # Blocker bluffed
-                self._lose_influence(blocker)
-                self.players[self.pending_action.actor].coins += 2
-                self._clear_pending()
-        elif self.pending_action.type == ActionType.TAX:
-            # Opponent challenges the Duke claim
-            challenger = action.actor
-            actor = self.pending_action.actor
-            if self._player_has_role(actor, Role.DUKE):
-                # Actor truthful: reveal Duke, challenger loses 1, Tax succeeds
-                self._truthful_reveal(actor, Role.DUKE)
-                self._lose_influence(challenger)
-                self.players[actor].coins += 3
-                self._clear_pending()
-            else:
-                # Actor bluffed: loses 1, Tax fails
-                self._lose_influence(actor)
-                self._clear_pending()
-        elif self.pending_action.type == ActionType.EXCHANGE:
-            # Challenge to Ambassador claim
-            challenger = action.actor
-            actor = self.pending_action.actor
-            if self._player_has_role(actor, Role.AMBASSADOR):
-                self._truthful_reveal(actor, Role.AMBASSADOR)
-                self._lose_influence(challenger)
-                self._perform_exchange(actor)
-                self._clear_pending()
-            else:
-                self._lose_influence(actor)
-                self._clear_pending()
-        elif self.pending_action.type == ActionType.STEAL:
-            actor = self.pending_action.actor
-            target = self.pending_action.target
-            assert target is not None
-            if self.pending_blocker is None:
-                # Challenge the Captain claim
-                challenger = action.actor
-                if self._player_has_role(actor, Role.CAPTAIN):
-                    self._truthful_reveal(actor, Role.CAPTAIN)
-                    self._lose_influence(challenger)
-                    self._apply_steal_transfer()
-                    self._clear_pending()
-                else:
-                    self._lose_influence(actor)
-                    self._clear_pending()
-            else:
-                # Challenge the block (either Captain or Ambassador)
-                challenger = action.actor
-                blocker = self.pending_blocker
-                if self.pending_block_role == Role.CAPTAIN:
-                    if self._player_has_role(blocker, Role.CAPTAIN):
-                        self._truthful_reveal(blocker, Role.CAPTAIN)
-                        self._lose_influence(challenger)
-                        self._clear_pending()
-                    else:
-                        self._lose_influence(blocker)
-                        self._apply_steal_transfer()
-                        self._clear_pending()
-                elif self.pending_block_role == Role.AMBASSADOR:
-                    if self._player_has_role(blocker, Role.AMBASSADOR):
-                        self._truthful_reveal(blocker, Role.AMBASSADOR)
-                        self._lose_influence(challenger)
-                        self._clear_pending()
-                    else:
-                        self._lose_influence(blocker)
-                        self._apply_steal_transfer()
-                        self._clear_pending()
-        elif self.pending_action.type == ActionType.ASSASSINATE:
-            actor = self.pending_action.actor
-            target = self.pending_action.target
-            assert target is not None
-            if self.pending_blocker is None:
-                # Challenge to the assassin claim itself
-                challenger = action.actor
-                if self._player_has_role(actor, Role.ASSASSIN):
-                    # Actor truthful: reveal Assassin, challenger loses 1, assassination succeeds
-                    self._truthful_reveal(actor, Role.ASSASSIN)
-                    self._lose_influence(challenger)
-                    self._lose_influence(target)
-                    self._clear_pending()
-                else:
-                    # Actor bluffed: loses 1, assassination fails (coins not refunded)
-                    self._lose_influence(actor)
-                    self._clear_pending()
-            else:
-                # Challenge to the Contessa block
-                assert self.pending_block_role == Role.CONTESSA
-                challenger = action.actor
-                blocker = self.pending_blocker
-                if self._player_has_role(blocker, Role.CONTESSA):
-                    # Blocker truthful: reveal Contessa, challenger loses 1, assassination fails
-                    self._truthful_reveal(blocker, Role.CONTESSA)
-                    self._lose_influence(challenger)
-                    self._clear_pending()
-                else:
-                    # Blocker bluffed: blocker loses 1, assassination succeeds (target loses another)
-                    self._lose_influence(blocker)
-                    self._lose_influence(target)
-                    self._clear_pending()
+        # Resolve through _CHALLENGE_HANDLERS, keyed by what is being challenged: the pending
+        # action's claim (block role None) or the declared block
+        pa = self.pending_action
+        assert pa is not None
+        handler = _CHALLENGE_HANDLERS.get((pa.type, self.pending_block_role))
+        assert handler is not None, f"Nothing to challenge for {pa} (block role {self.pending_block_role})"
+        handler(self, action.actor, pa)
+        self._clear_pending()
+
+    def _challenge_foreign_aid_block(self, challenger: int, pa: Action) -> None:
+        blocker = self.pending_blocker
+        if self._player_has_role(blocker, Role.DUKE):
+            # Blocker truthful
+            self._truthful_reveal(blocker, Role.DUKE)
+            self._lose_influence(challenger)
+        else:
+            # Blocker bluffed
+            self._lose_influence(blocker)
+            self.players[pa.actor].coins += 2
+
+    def _challenge_tax(self, challenger: int, pa: Action) -> None:
+        # Opponent challenges the Duke claim
+        actor = pa.actor
+        if self._player_has_role(actor, Role.DUKE):
+            # Actor truthful: reveal Duke, challenger loses 1, Tax succeeds
+            self._truthful_reveal(actor, Role.DUKE)
+            self._lose_influence(challenger)
+            self.players[actor].coins += 3
+        else:
+            # Actor bluffed: loses 1, Tax fails
+            self._lose_influence(actor)
+
+    def _challenge_exchange(self, challenger: int, pa: Action) -> None:
+        # Challenge to Ambassador claim
+        actor = pa.actor
+        if self._player_has_role(actor, Role.AMBASSADOR):
+            self._truthful_reveal(actor, Role.AMBASSADOR)
+            self._lose_influence(challenger)
+            self._perform_exchange(actor)
+        else:
+            self._lose_influence(actor)
+
+    def _challenge_steal(self, challenger: int, pa: Action) -> None:
+        # Challenge the Captain claim
+        actor = pa.actor
+        assert pa.target is not None
+        if self._player_has_role(actor, Role.CAPTAIN):
+            self._truthful_reveal(actor, Role.CAPTAIN)
+            self._lose_influence(challenger)
+            self._apply_steal_transfer()
+        else:
+            self._lose_influence(actor)
+
+    def _challenge_steal_block(self, challenger: int, pa: Action) -> None:
+        # Challenge the block (either Captain or Ambassador)
+        assert pa.target is not None
+        blocker = self.pending_blocker
+        role = self.pending_block_role
+        if self._player_has_role(blocker, role):
+            self._truthful_reveal(blocker, role)
+            self._lose_influence(challenger)
+        else:
+            self._lose_influence(blocker)
+            self._apply_steal_transfer()
+
+    def _challenge_assassinate(self, challenger: int, pa: Action) -> None:
+        # Challenge to the assassin claim itself
+        actor = pa.actor
+        target = pa.target
+        assert target is not None
+        if self._player_has_role(actor, Role.ASSASSIN):
+            # Actor truthful: reveal Assassin, challenger loses 1, assassination succeeds
+            self._truthful_reveal(actor, Role.ASSASSIN)
+            self._lose_influence(challenger)
+            self._lose_influence(target)
+        else:
+            # Actor bluffed: loses 1, assassination fails (coins not refunded)
+            self._lose_influence(actor)
+
+    def _challenge_assassinate_block(self, challenger: int, pa: Action) -> None:
+        # Challenge to the Contessa block
+        target = pa.target
+        assert target is not None
+        blocker = self.pending_blocker
+        if self._player_has_role(blocker, Role.CONTESSA):
+            # Blocker truthful: reveal Contessa, challenger loses 1, assassination fails
+            self._truthful_reveal(blocker, Role.CONTESSA)
+            self._lose_influence(challenger)
+        else:
+            # Blocker bluffed: blocker loses 1, assassination succeeds (target loses another)
+            self._lose_influence(blocker)
+            self._lose_influence(target)
 
     def _apply_coup(self, action: Action) -> None:
         assert action.target is not None, "Coup requires a target"
@@ -445,31 +577,39 @@ class GameState:
         assert actor_ps.coins >= self.rules.coup_cost, "Insufficient coins for coup"
         actor_ps.coins -= self.rules.coup_cost
         # Target chooses a card to lose; until choice system exists, remove the first card deterministically
+        self._touch_cards(action.target)
         if target_ps.hand:
             lost = target_ps.hand.pop(0)
             target_ps.revealed.append(lost)
 
     # --- Common helpers ---
     def _player_has_role(self, pid: int, role: Role) -> bool:
-        return role in self.players[pid].hand
+        return self.players[pid].has(role)
 
     def _truthful_reveal(self, pid: int, role: Role) -> None:
         # Reveal role from hand, then shuffle it back into deck and draw a replacement.
-        ps = self.players[pid]
-        assert role in ps.hand, "Cannot truthfully reveal a role not in hand"
-        ps.hand.remove(role)
+        hand = self.players[pid].hand
+        # Hands hold at most two cards: one index() scan both checks and locates the role
+        try:
+            i = hand.index(role)
+        except ValueError:
+            raise AssertionError("Cannot truthfully reveal a role not in hand") from None
+        self._touch_cards(pid)
+        self._touch_deck(shuffles=True)
+        del hand[i]
         # Show and return to deck, shuffle, draw
-        self.deck.append(role)
-        self.rng.shuffle(self.deck)
-        if self.deck:
-            ps.hand.append(self.deck.pop())
+        deck = self.deck
+        deck.append(role)
+        self.rng.shuffle(deck)
+        hand.append(deck.pop())
 
     def _lose_influence(self, pid: int) -> None:
         ps = self.players[pid]
+        self._touch_cards(pid)
         if ps.hand:
             lost = ps.hand.pop(0)
             ps.revealed.append(lost)
-        
+
     def _clear_pending(self) -> None:
         self.pending_action = None
         self.pending_blocker = None
@@ -517,21 +657,55 @@ class GameState:
 
     def _perform_exchange(self, actor: int) -> None:
         # Deterministic: draw top 2 from deck, choose 2 to keep among 4 by sorted name, return others to bottom
-        drawn: List[Role] = []
-        for _ in range(2):
-            if self.deck:
-                drawn.append(self.deck.pop(0))
+        self._touch_cards(actor)
+        self._touch_deck(shuffles=False)
+        # Take both cards with one slice + one delete (a single memmove) rather than two pop(0)s
+        drawn: List[Role] = self.deck[:2]
+        del self.deck[:2]
         combined = self.players[actor].hand + drawn
         # keep exactly cards_per_player
         keep_n = self.rules.cards_per_player
-        kept = sorted(combined, key=lambda r: r.value)[:keep_n]
-        returned = [r for r in combined if r not in kept or kept.count(r) < combined.count(r)]
+        kept = sorted(combined, key=lambda r: ROLE_NAMES[r])[:keep_n]
+        # Multiset difference combined - kept, in combined order
+        remaining = Counter(kept)
+        returned: List[Role] = []
+        for r in combined:
+            if remaining[r]:
+                remaining[r] -= 1
+            else:
+                returned.append(r)
         # Update hand
         self.players[actor].hand = kept
         # Return others to bottom of deck, preserve current order of 'returned'
         self.deck.extend(returned)
 
-    @staticmethod
-    def _as_set(actions: List[Action]) -> List[Action]:
-        # dataclass equality makes list membership fine; keep helper to clarify intent
-        return actions
+
+# apply() handlers indexed by ActionType, called as handler(state, action)
+_APPLY_HANDLERS = tuple({
+    ActionType.INCOME: GameState._apply_income,
+    ActionType.FOREIGN_AID: GameState._start_foreign_aid_interaction,
+    ActionType.COUP: GameState._apply_coup,
+    ActionType.TAX: GameState._start_tax_interaction,
+    ActionType.STEAL: GameState._start_steal_interaction,
+    ActionType.ASSASSINATE: GameState._start_assassinate_interaction,
+    ActionType.EXCHANGE: GameState._start_exchange_interaction,
+    ActionType.PASS: GameState._apply_pass,
+    ActionType.BLOCK_FOREIGN_AID: GameState._apply_block_foreign_aid,
+    ActionType.BLOCK_ASSASSINATE: GameState._apply_block_assassinate,
+    ActionType.BLOCK_STEAL_CAPTAIN: GameState._apply_block_steal_captain,
+    ActionType.BLOCK_STEAL_AMBASSADOR: GameState._apply_block_steal_ambassador,
+    ActionType.CHALLENGE: GameState._apply_challenge,
+}[t] for t in ActionType)
+
+# Challenge resolution keyed by (pending action type, declared block role or None when the
+# action's own claim is challenged), called as handler(state, challenger, pending_action)
+_CHALLENGE_HANDLERS = {
+    (ActionType.FOREIGN_AID, Role.DUKE): GameState._challenge_foreign_aid_block,
+    (ActionType.TAX, None): GameState._challenge_tax,
+    (ActionType.EXCHANGE, None): GameState._challenge_exchange,
+    (ActionType.STEAL, None): GameState._challenge_steal,
+    (ActionType.STEAL, Role.CAPTAIN): GameState._challenge_steal_block,
+    (ActionType.STEAL, Role.AMBASSADOR): GameState._challenge_steal_block,
+    (ActionType.ASSASSINATE, None): GameState._challenge_assassinate,
+    (ActionType.ASSASSINATE, Role.CONTESSA): GameState._challenge_assassinate_block,
+}
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from typing import Callable, List
+import random
+
+
+MASK64 = (1 << 64) - 1
+# Coin counts at or above COIN_BUCKETS - 1 share the last key; the mandatory coup keeps
+# purses far below it in play
+COIN_BUCKETS = 32
+
+
+def key_stream(seed: int) -> Callable[[int], List[int]]:
+    # Returns keys(n), which draws the next n random 64-bit keys from a fixed-seed stream;
+    # the fixed seed keeps tables (and anything hashed with them) stable across processes
+    rng = random.Random(seed)
+
+    def keys(n: int) -> List[int]:
+        return [rng.getrandbits(64) for _ in range(n)]
+
+    return keys
@@ -1,11 +1,35 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from types import MappingProxyType
+from typing import List, Mapping, Tuple
 
 from coup_gto.engine.actions import ActionType, Role
 
 
+# Standard rules tables, shared read-only by every BaseRules instance
+_DECK_COUNTS: Mapping[Role, int] = MappingProxyType({
+    Role.DUKE: 3,
+    Role.ASSASSIN: 3,
+    Role.CAPTAIN: 3,
+    Role.AMBASSADOR: 3,
+    Role.CONTESSA: 3,
+})
+# The full deck in deck_counts order, built once
+_FULL_DECK: Tuple[Role, ...] = tuple(role for role, cnt in _DECK_COUNTS.items() for _ in range(cnt))
+_BLOCKS: Mapping[ActionType, Tuple[Role, ...]] = MappingProxyType({
+    ActionType.FOREIGN_AID: (Role.DUKE,),
+    ActionType.ASSASSINATE: (Role.CONTESSA,),
+    ActionType.STEAL: (Role.CAPTAIN, Role.AMBASSADOR),
+})
+_CLAIMS: Mapping[ActionType, Role] = MappingProxyType({
+    ActionType.TAX: Role.DUKE,
+    ActionType.ASSASSINATE: Role.ASSASSIN,
+    ActionType.STEAL: Role.CAPTAIN,
+    ActionType.EXCHANGE: Role.AMBASSADOR,
+})
+
+
 @dataclass(frozen=True)
 class BaseRules:
     # Core numeric params
@@ -16,48 +40,33 @@ class BaseRules:
     mandatory_coup_threshold: int = 10
 
     # Deck composition
-    deck_counts: Dict[Role, int] = None  # set in __post_init__ for immutability
+    deck_counts: Mapping[Role, int] = None  # set in __post_init__ for immutability
 
     # Block graph (who can block what) — reference only for now
-    blocks: Dict[ActionType, Tuple[Role, ...]] = None
+    blocks: Mapping[ActionType, Tuple[Role, ...]] = None
 
     # Claimed-action mapping (for reference)
-    claims: Dict[ActionType, Role] = None
+    claims: Mapping[ActionType, Role] = None
 
     def __post_init__(self):
-        object.__setattr__(
-            self,
-            "deck_counts",
-            {
-                Role.DUKE: 3,
-                Role.ASSASSIN: 3,
-                Role.CAPTAIN: 3,
-                Role.AMBASSADOR: 3,
-                Role.CONTESSA: 3,
-            },
-        )
-        object.__setattr__(
-            self,
-            "blocks",
-            {
-                ActionType.FOREIGN_AID: (Role.DUKE,),
-                ActionType.ASSASSINATE: (Role.CONTESSA,),
-                ActionType.STEAL: (Role.CAPTAIN, Role.AMBASSADOR),
-            },
-        )
-        object.__setattr__(
-            self,
-            "claims",
-            {
-                ActionType.TAX: Role.DUKE,
-                ActionType.ASSASSINATE: Role.ASSASSIN,
-                ActionType.STEAL: Role.CAPTAIN,
-                ActionType.EXCHANGE: Role.AMBASSADOR,
-            },
+        # Point at the shared read-only tables rather than building fresh dicts per instance
+        object.__setattr__(self, "deck_counts", _DECK_COUNTS)
+        object.__setattr__(self, "blocks", _BLOCKS)
+        object.__setattr__(self, "claims", _CLAIMS)
+
+    def __reduce__(self):
+        # mappingproxy can't be pickled; __post_init__ restores the shared tables on load
+        return (
+            type(self),
+            (
+                self.starting_coins,
+                self.cards_per_player,
+                self.coup_cost,
+                self.assassinate_cost,
+                self.mandatory_coup_threshold,
+            ),
         )
 
     def full_deck(self) -> List[Role]:
-        deck: List[Role] = []
-        for role, cnt in self.deck_counts.items():
-            deck.extend([role] * cnt)
-        return deck
+        # Fresh list per call; callers shuffle and deal from it in place
+        return list(_FULL_DECK)
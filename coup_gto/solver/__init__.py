@@ -1 +1,8 @@
 from .mccfr import MCCFRSolver, NodeStats, infoset_key, action_key
+
+__all__ = [
+    "MCCFRSolver",
+    "NodeStats",
+    "infoset_key",
+    "action_key",
+]
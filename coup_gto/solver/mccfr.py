@@ -1,91 +1,154 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, chain
 import math
 import random
 
-from coup_gto.engine.actions import Action, ActionType
+from coup_gto.engine.actions import ACTION_IDS, ACTION_NAMES, Action, ActionType, Role
 from coup_gto.engine.state import GameState
+from coup_gto.engine.zobrist import COIN_BUCKETS, MASK64, key_stream
+from coup_gto.rules.base import BaseRules
 
 
-def action_key(a: Action) -> str:
-    t = a.type.name
-    tgt = "-" if a.target is None else str(a.target)
-    return f"{t}:{tgt}"
+def action_key(a: Action) -> int:
+    # Dense (type, target) id; the actor is implied by the infoset
+    return ACTION_IDS[a.type, a.target]
 
 
-def infoset_key(gs: GameState, player: int) -> str:
-    # 2-player encoding: public state + acting player's private info if player == gs.current_player
-    # Public: current_player, coins, revealed, pending flags
-    pub = []
-    pub.append(str(gs.current_player))
-    pub.append(
-        f"c:{gs.players[0].coins},{gs.players[1].coins}"
-    )
-    pub.append(
-        "r0:" + ",".join(sorted([r.name for r in gs.players[0].revealed]))
-    )
-    pub.append(
-        "r1:" + ",".join(sorted([r.name for r in gs.players[1].revealed]))
+# Zobrist-style infoset hashing: one random 64-bit key per (field, value), combined by
+# addition mod 2**64 rather than XOR so repeated roles in a hand or reveal pile don't cancel.
+# Fixed seed keeps keys stable across processes and checkpoints.
+_NUM_ROLES = len(Role)
+_z_keys = key_stream(0x1F05E7)
+
+_Z_CUR = _z_keys(2)
+_Z_COINS = (_z_keys(COIN_BUCKETS), _z_keys(COIN_BUCKETS))
+_Z_REVEALED = (_z_keys(_NUM_ROLES), _z_keys(_NUM_ROLES))
+# Pending action indexed by (type, actor, target + 1 with 0 for no target)
+_Z_PENDING = _z_keys(len(ActionType) * 2 * 3)
+_Z_BLOCK_ROLE = _z_keys(_NUM_ROLES)
+_Z_BLOCKER = _z_keys(2)
+_Z_AWAITING = _z_keys(2)
+_Z_CLAIM_ROLE = _z_keys(_NUM_ROLES)
+_Z_HAND = _z_keys(_NUM_ROLES)
+
+
+def infoset_key(gs: GameState, player: int) -> int:
+    # 2-player key over public state (current_player, coins, revealed roles, pending flags)
+    # + the perspective player's hand. Summing per-card keys makes hands order-independent
+    # without sorting, matching perfect recall on own info. Unset pending fields add nothing.
+    p0, p1 = gs.players[0], gs.players[1]
+    h = (
+        _Z_CUR[gs.current_player]
+        + _Z_COINS[0][min(p0.coins, COIN_BUCKETS - 1)]
+        + _Z_COINS[1][min(p1.coins, COIN_BUCKETS - 1)]
     )
+    rev = _Z_REVEALED[0]
+    for r in p0.revealed:
+        h += rev[r]
+    rev = _Z_REVEALED[1]
+    for r in p1.revealed:
+        h += rev[r]
     # Pending interaction summary
     pa = gs.pending_action
-    if pa is None:
-        pub.append("pa:None")
-    else:
-        pub.append(f"pa:{pa.type.name}:{pa.actor}:{-1 if pa.target is None else pa.target}")
-    pub.append(
-        "pr:" + ("None" if gs.pending_block_role is None else gs.pending_block_role.name)
-    )
-    pub.append(
-        "pb:" + ("None" if gs.pending_blocker is None else str(gs.pending_blocker))
-    )
-    pub.append(
-        "ar:" + ("None" if gs.awaiting_response_from is None else str(gs.awaiting_response_from))
-    )
-    pub.append(
-        "cr:" + ("None" if gs.pending_claim_role is None else gs.pending_claim_role.name)
-    )
+    if pa is not None:
+        h += _Z_PENDING[(pa.type * 2 + pa.actor) * 3 + (0 if pa.target is None else pa.target + 1)]
+    if gs.pending_block_role is not None:
+        h += _Z_BLOCK_ROLE[gs.pending_block_role]
+    if gs.pending_blocker is not None:
+        h += _Z_BLOCKER[gs.pending_blocker]
+    if gs.awaiting_response_from is not None:
+        h += _Z_AWAITING[gs.awaiting_response_from]
+    if gs.pending_claim_role is not None:
+        h += _Z_CLAIM_ROLE[gs.pending_claim_role]
+    # Private info for perspective player
+    for r in gs.players[player].hand:
+        h += _Z_HAND[r]
+    return h & MASK64
+
+
+# Binary checkpoint layout: magic, uint32 header length, JSON header (version, counts, config),
+# then the raw bytes of keys array('Q'), sizes array('H') and the two flat sum arrays('d')
+_CKPT_MAGIC = b"CGTOCKPT"
+_CKPT_VERSION = 1
+
+# Share of the updating player's sampled-mode choices drawn uniformly rather than on-policy
+_OS_EXPLORATION = 0.6
 
-    parts = ["|".join(pub)]
+# Utilities are +/-1 and reach weights <= 1, so a single regret update moves an action's
+# regret by at most this much. Regret-based pruning sizes its skip windows as if each
+# iteration applied one update per infoset; an infoset reached several times in one
+# iteration can gain more, so the windows are a heuristic, not a safety bound.
+_RBP_MAX_GAIN = 2.0
 
-    # Private info for perspective player: their hand (sorted), only to ensure perfect recall on own info
-    hand = sorted([r.name for r in gs.players[player].hand])
-    parts.append("h:" + ",".join(hand))
+# Smallest sampling probability a sampled line may carry into the regret update. The product
+# of per-step probabilities can underflow on long lines (max_depth in the thousands); below
+# this floor 1 / sample_prob is no longer a usable weight, so the line's regrets are skipped.
+_OS_MIN_SAMPLE_PROB = 1e-100
 
-    return "||".join(parts)
+# Iterations per parallel round. Every round ships the whole node table to each worker and
+# ships delta tables back, so rounds must be long enough for training to dominate the IPC.
+_PARALLEL_ROUND_ITERATIONS = 1000
 
 
-@dataclass
 class NodeStats:
-    def __init__(self):
-        self.regret_sum: Dict[str, float] = {}
-        self.strategy_sum: Dict[str, float] = {}
-
-    def get_strategy(self, legal: List[Action], realization_weight: float = 0.0) -> List[float]:
-        # Build current strategy from positive regrets (regret-matching)
-        regrets = [max(0.0, self.regret_sum.get(action_key(a), 0.0)) for a in legal]
-        normalizer = sum(regrets)
-        if normalizer <= 0.0:
-            strategy = [1.0 / len(legal)] * len(legal) if legal else []
-        else:
-            strategy = [r / normalizer for r in regrets]
+    # Dense per-action sums, indexed by position in the infoset's legal tuple. Legal sets
+    # are a function of the public state and acting player (all part of the infoset key)
+    # and are returned in a fixed order, so position is a stable compact action id.
+    # One instance per infoset: slots keep them free of a per-instance __dict__.
+    __slots__ = ("regret_sum", "strategy_sum", "strategy_total", "current", "cum", "dirty", "skip_until")
+
+    def __init__(self, num_actions: int = 0):
+        self.regret_sum: List[float] = [0.0] * num_actions
+        self.strategy_sum: List[float] = [0.0] * num_actions
+        # Running sum(strategy_sum); whoever replaces strategy_sum must reset it
+        self.strategy_total = 0.0
+        # Current strategy and its running sums for inverse-CDF sampling, rebuilt from
+        # regret_sum only after it changes; writers of regret_sum set dirty = True
+        self.current: List[float] = []
+        self.cum: List[float] = []
+        self.dirty = True
+        # Per-action iteration before which regret-based pruning skips the action (lazily sized)
+        self.skip_until: List[int] = []
+
+    def get_strategy(self, legal: Sequence[Action], realization_weight: float = 0.0) -> List[float]:
+        if self.dirty:
+            # Build current strategy from positive regrets (regret-matching).
+            regrets = [r if r > 0.0 else 0.0 for r in self.regret_sum]
+            normalizer = sum(regrets)
+            if normalizer <= 0.0:
+                self.current = [1.0 / len(legal)] * len(legal) if legal else []
+            else:
+                self.current = [r / normalizer for r in regrets]
+            self.cum = list(accumulate(self.current))
+            self.dirty = False
+        strategy = self.current
         # Accumulate average strategy using player's reach weight
         if realization_weight > 0.0 and legal:
-            for p, a in zip(strategy, legal):
-                k = action_key(a)
-                self.strategy_sum[k] = self.strategy_sum.get(k, 0.0) + realization_weight * p
+            strategy_sum = self.strategy_sum
+            for i, p in enumerate(strategy):
+                strategy_sum[i] += realization_weight * p
+            # The current strategy sums to 1, so the whole increment is the reach weight
+            self.strategy_total += realization_weight
         return strategy
 
-    def get_average_strategy(self, legal: List[Action]) -> List[float]:
+    def sample(self, r: float) -> int:
+        # Inverse-CDF sample from the current strategy (call get_strategy first): first index
+        # whose cumulative weight reaches r, clamped in case rounding leaves the total below r
+        cum = self.cum
+        return min(bisect_left(cum, r), len(cum) - 1)
+
+    def get_average_strategy(self, legal: Sequence[Action]) -> List[float]:
         if not legal:
             return []
-        vals = [self.strategy_sum.get(action_key(a), 0.0) for a in legal]
-        s = sum(vals)
+        s = self.strategy_total
         if s <= 1e-12:
             return [1.0 / len(legal)] * len(legal)
-        return [v / s for v in vals]
+        return [v / s for v in self.strategy_sum]
 
 
 class MCCFRSolver:
@@ -96,30 +159,254 @@ class MCCFRSolver:
         debug: bool = False,
         traversal_mode: str = "sampled",  # 'sampled' (default) or 'full'
         log_infoset_hash: bool = False,
+        regret_pruning: bool = False,  # regret-based pruning in 'full' traversal
+        cfr_plus: bool = False,  # floor regrets at 0 and weight strategy averages by iteration
     ):
-        self.nodes: Dict[str, NodeStats] = {}
+        if regret_pruning and traversal_mode != "full":
+            raise ValueError("regret_pruning requires traversal_mode='full'")
+        self.nodes: Dict[int, NodeStats] = {}
         self.rng = random.Random(seed)
         self.max_depth = max_depth
         self.debug = debug
         self.traversal_mode = traversal_mode
         self.log_infoset_hash = log_infoset_hash
+        self.regret_pruning = regret_pruning
+        self.cfr_plus = cfr_plus
+        # Completed-or-running iteration count; pruning windows are measured against it
+        self.iteration = 0
+        # Rules are immutable; one instance is shared by every game the solver deals
+        self.rules = BaseRules()
+        # Legal actions per infoset key: the legal set is a function of fields in the key
+        self._legal_cache: Dict[int, Tuple[Action, ...]] = {}
 
     def iterate(self, iterations: int = 1, game_seed: Optional[int] = None):
         for _ in range(iterations):
-            # Run two traversals, one for each player as the updating player
-            for updating_player in (0, 1):
-                gs = GameState(num_players=2, seed=game_seed if game_seed is not None else self.rng.randrange(1 << 30))
+            self._iterate_once(game_seed)
+
+    def iterate_with_progress(
+        self,
+        total: int,
+        interval: int,
+        game_seed: Optional[int] = None,
+        cb: Optional[Callable[[int], None]] = None,
+        workers: int = 1,
+    ) -> None:
+        # Run the whole budget in one call, invoking cb(done) every `interval` iterations
+        # and once at the end; interval <= 0 reports only on completion.
+        # With workers > 1 training runs in rounds of _PARALLEL_ROUND_ITERATIONS regardless of
+        # the interval; progress can only be observed between rounds, so cb(done) fires after
+        # each round that crosses an interval boundary.
+        if interval <= 0 or interval > total:
+            interval = total
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                done = 0
+                while done < total:
+                    step = min(_PARALLEL_ROUND_ITERATIONS, total - done)
+                    self._iterate_parallel_round(pool, step, workers, game_seed)
+                    crossed = (done + step) // interval > done // interval
+                    done += step
+                    if cb is not None and (crossed or done == total):
+                        cb(done)
+            return
+        for done in range(1, total + 1):
+            self._iterate_once(game_seed)
+            if cb is not None and (done % interval == 0 or done == total):
+                cb(done)
+
+    def iterate_parallel(self, iterations: int, workers: int, game_seed: Optional[int] = None) -> None:
+        # Shard iterations across worker processes. Each worker trains a private copy of the
+        # current tables and returns its regret/strategy increments; outcome-sampling sums are
+        # additive across independent traversals, so the increments are summed back in.
+        if workers <= 1:
+            self.iterate(iterations, game_seed=game_seed)
+            return
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            self._iterate_parallel_round(pool, iterations, workers, game_seed)
+
+    def _iterate_parallel_round(self, pool: ProcessPoolExecutor, iterations: int, workers: int, game_seed: Optional[int]) -> None:
+        if self.regret_pruning:
+            # Workers schedule skip windows against their own iteration counts; those are not
+            # merged back, so pruning would silently do nothing
+            raise ValueError("regret_pruning is not supported with parallel workers")
+        shards = [iterations // workers + (1 if i < iterations % workers else 0) for i in range(workers)]
+        # Each shard numbers its iterations after the earlier shards', so CFR+ linear averaging
+        # weights the round's iterations 1..iterations past the base instead of repeating them
+        futures = []
+        start = self.iteration
+        for n in shards:
+            if n <= 0:
+                continue
+            futures.append(
+                pool.submit(
+                    _run_shard,
+                    self.nodes,
+                    self.rng.randrange(1 << 30),
+                    self.max_depth,
+                    self.traversal_mode,
+                    self.cfr_plus,
+                    start,
+                    n,
+                    game_seed,
+                )
+            )
+            start += n
+        for fut in futures:
+            self._merge_deltas(fut.result())
+        self.iteration += iterations
+
+    def _merge_deltas(self, deltas: Dict[int, Tuple[List[float], List[float]]]) -> None:
+        for k, (d_regret, d_strategy) in deltas.items():
+            node = self.nodes.get(k)
+            if node is None:
+                node = self.nodes[k] = NodeStats(len(d_regret))
+            if self.cfr_plus:
+                # Each worker floors its own regrets, but summed deltas can still go negative
+                node.regret_sum = [max(0.0, x + d) for x, d in zip(node.regret_sum, d_regret)]
+            else:
+                node.regret_sum = [x + d for x, d in zip(node.regret_sum, d_regret)]
+            node.strategy_sum = [x + d for x, d in zip(node.strategy_sum, d_strategy)]
+            node.strategy_total = sum(node.strategy_sum)
+            node.dirty = True
+
+    def _iterate_once(self, game_seed: Optional[int]) -> None:
+        # Run two traversals, one for each player as the updating player
+        self.iteration += 1
+        for updating_player in (0, 1):
+            gs = GameState(
+                num_players=2,
+                seed=game_seed if game_seed is not None else self.rng.randrange(1 << 30),
+                rules=self.rules,
+            )
+            if self.traversal_mode == "full":
                 self._mccfr_traverse(gs, updating_player, reach_prob_other=1.0, reach_prob_updating=1.0, depth=0)
+            else:
+                self._sampled_traverse(gs, updating_player)
+
+    def _sampled_traverse(self, gs: GameState, updating_player: int) -> float:
+        # Outcome-sampling traversal as a loop: follow one sampled line down to a terminal (or
+        # the depth cap), recording the updating player's decisions on `trace`, then apply
+        # their regret updates once the outcome is known. Advances `gs` in place.
+        trace: List[Tuple[NodeStats, int, List[float]]] = []
+        reach_prob_other = 1.0
+        reach_prob_updating = 1.0
+        # Probability of the updating player's sampled choices on this line
+        sample_prob = 1.0
+        depth = 0
+        nodes = self.nodes
+        legal_cache = self._legal_cache
+        # Linear averaging (CFR+) weights this iteration's strategy contributions by t
+        avg_weight = self.iteration if self.cfr_plus else 1
+        while True:
+            # Depth cap to prevent runaway lines in long interactions
+            if depth >= self.max_depth:
+                self._log_depth_cap(gs, depth)
+                u = 0.0
+                break
+            # Terminal check
+            w = gs.winner()
+            if w is not None:
+                # Utility +1 for win, -1 for loss for updating player
+                u = 1.0 if w == updating_player else -1.0
+                break
+
+            current = gs.current_player
+            key = infoset_key(gs, current)
+            legal = legal_cache.get(key)
+            if legal is None:
+                legal = legal_cache[key] = gs.legal_actions()
+            # get-then-insert: setdefault would build a throwaway NodeStats on every hit
+            node = nodes.get(key)
+            if node is None:
+                node = nodes[key] = NodeStats(len(legal))
+
+            if current == updating_player:
+                # For averaging, weight by the updating player's reach probability at this infoset
+                strategy = node.get_strategy(legal, realization_weight=reach_prob_updating * avg_weight)
+                # Explore: with probability _OS_EXPLORATION pick uniformly instead of on-policy,
+                # so low-probability actions keep getting sampled and their estimates stay bounded
+                n = len(legal)
+                if self.rng.random() < _OS_EXPLORATION:
+                    idx = min(int(self.rng.random() * n), n - 1)
+                else:
+                    idx = node.sample(self.rng.random())
+                sample_prob *= _OS_EXPLORATION / n + (1.0 - _OS_EXPLORATION) * strategy[idx]
+                a = legal[idx]
+                # Optional debug
+                if self.debug:
+                    if self.log_infoset_hash:
+                        key_dbg = hex(hash(key) & 0xFFFFFFFF)
+                    else:
+                        key_dbg = f"{key:016x}"
+                    print(f"[MCCFR] sampled mode depth={depth} cur={current} act={ACTION_NAMES[a.type]} idx={idx} infoset={key_dbg}")
+                reach_prob_updating *= strategy[idx]
+                trace.append((node, idx, strategy))
+            else:
+                # Opponent node: compute their current strategy and update their average with their reach
+                strategy = node.get_strategy(legal, realization_weight=reach_prob_other * avg_weight)
+                idx = node.sample(self.rng.random()) if legal else 0
+                a = legal[idx]
+                reach_prob_other *= strategy[idx]
+            # A sampled line never backtracks, so the state is advanced in place
+            gs.apply_unchecked(a)
+            depth += 1
+
+        # Outcome-sampling regret update for every action at each recorded decision, walking
+        # back from the outcome. Opponent choices are sampled on-policy, so their reach cancels
+        # against their sampling probability; the sampled action's counterfactual value is then
+        # u * (updating player's reach from the child to the outcome) / sample_prob. Unsampled
+        # actions are valued 0, and the node's value is strategy[idx] times the sampled one's.
+        if u == 0.0 or sample_prob < _OS_MIN_SAMPLE_PROB:
+            # Depth-capped lines change no regret; underflowed ones would divide by ~0
+            return u
+        cfr_plus = self.cfr_plus
+        scale = u / sample_prob
+        tail = 1.0
+        for node, idx, strategy in reversed(trace):
+            v = scale * tail
+            node_value = strategy[idx] * v
+            regret_sum = node.regret_sum
+            # Only a real change invalidates the cached strategy: single-action nodes and
+            # CFR+ floors at 0 leave the regrets as they were
+            changed = False
+            for i, r0 in enumerate(regret_sum):
+                r = r0 + (v if i == idx else 0.0) - node_value
+                if cfr_plus and r < 0.0:
+                    r = 0.0
+                if r != r0:
+                    regret_sum[i] = r
+                    changed = True
+            if changed:
+                node.dirty = True
+            tail *= strategy[idx]
+        return u
+
+    def _schedule_pruning(self, node: NodeStats) -> None:
+        # Heuristic window: an action at regret -r is skipped for r / _RBP_MAX_GAIN iterations,
+        # the time it needs to recover at one maximal update per iteration
+        skip = node.skip_until
+        if not skip:
+            skip = node.skip_until = [0] * len(node.regret_sum)
+        t = self.iteration
+        for i, r in enumerate(node.regret_sum):
+            if r < -_RBP_MAX_GAIN and skip[i] <= t:
+                skip[i] = t + math.ceil(-r / _RBP_MAX_GAIN)
+
+    def _log_depth_cap(self, gs: GameState, depth: int) -> None:
+        if self.debug:
+            try:
+                key_dbg = f"{infoset_key(gs, gs.current_player):016x}"
+            except Exception:
+                key_dbg = "<infoset_error>"
+            print(f"[MCCFR] depth cap reached at depth={depth}, infoset={key_dbg}")
 
     def _mccfr_traverse(self, gs: GameState, updating_player: int, *, reach_prob_other: float, reach_prob_updating: float, depth: int) -> float:
+        # Full-branch traversal (traversal_mode='full'); sampled mode uses _sampled_traverse.
+        # Children are explored in place with apply_reversible()/undo(), so `gs` is unchanged
+        # on return.
         # Depth cap to prevent runaway recursion in long interactions
         if depth >= self.max_depth:
-            if self.debug:
-                try:
-                    key_dbg = infoset_key(gs, gs.current_player)
-                except Exception:
-                    key_dbg = "<infoset_error>"
-                print(f"[MCCFR] depth cap reached at depth={depth}, infoset={key_dbg}")
+            self._log_depth_cap(gs, depth)
             return 0.0
         # Terminal check
         w = gs.winner()
@@ -128,150 +415,249 @@ class MCCFRSolver:
             return 1.0 if w == updating_player else -1.0
 
         current = gs.current_player
-        legal = gs.legal_actions()
 
         # Chance events are embedded in apply() via RNG when drawing/shuffling.
         # This scaffolding treats all non-player-stochasticity as part of environment.
 
         # Always index by the decision-maker's infoset (current player)
         key = infoset_key(gs, current)
-        node = self.nodes.setdefault(key, NodeStats())
+        legal = self._legal_cache.get(key)
+        if legal is None:
+            legal = self._legal_cache[key] = gs.legal_actions()
+        node = self.nodes.get(key)
+        if node is None:
+            node = self.nodes[key] = NodeStats(len(legal))
 
         # If it's the updating player's decision
         if current == updating_player:
             # For averaging, weight by the updating player's reach probability at this infoset
-            strategy = node.get_strategy(legal, realization_weight=reach_prob_updating)
-            if self.traversal_mode == "full":
-                # Full-branch traversal: evaluate all legal actions for proper regret updates
-                action_utils: List[float] = []
-                for i, a in enumerate(legal):
-                    gs_next = self._clone_and_apply(gs, a)
-                    u = self._mccfr_traverse(
-                        gs_next,
-                        updating_player,
-                        reach_prob_other=reach_prob_other,
-                        reach_prob_updating=reach_prob_updating * strategy[i],
-                        depth=depth + 1,
-                    )
-                    action_utils.append(u)
-                node_utility = sum(p * u for p, u in zip(strategy, action_utils))
-                # Update regrets for all actions
-                keys = [action_key(a) for a in legal]
-                for k, u in zip(keys, action_utils):
-                    regret = u - node_utility
-                    node.regret_sum[k] = node.regret_sum.get(k, 0.0) + reach_prob_other * regret
-                return node_utility
-            else:
-                # Sampled traversal: pick one action to avoid exponential branching (fast path)
-                idx = self._sample_from_dist(strategy) if legal else 0
-                a = legal[idx]
-                gs_next = self._clone_and_apply(gs, a)
-                # Optional debug
-                if self.debug:
-                    if self.log_infoset_hash:
-                        key_dbg = hex(hash(key) & 0xFFFFFFFF)
-                    else:
-                        key_dbg = key
-                    print(f"[MCCFR] sampled mode depth={depth} cur={current} act={a.type.name} idx={idx} infoset={key_dbg}")
+            avg_weight = self.iteration if self.cfr_plus else 1
+            strategy = node.get_strategy(legal, realization_weight=reach_prob_updating * avg_weight)
+            # Full-branch traversal: evaluate all legal actions for proper regret updates
+            skip = node.skip_until if self.regret_pruning else None
+            action_utils: List[Optional[float]] = []
+            for i, a in enumerate(legal):
+                if skip and strategy[i] == 0.0 and skip[i] > self.iteration:
+                    # Regret-based pruning: this zero-probability action's regret is strongly
+                    # negative and its skip window has not ended, so it is not expanded
+                    action_utils.append(None)
+                    continue
+                rec = gs.apply_reversible(a)
                 u = self._mccfr_traverse(
-                    gs_next,
+                    gs,
                     updating_player,
                     reach_prob_other=reach_prob_other,
-                    reach_prob_updating=reach_prob_updating * strategy[idx],
+                    reach_prob_updating=reach_prob_updating * strategy[i],
                     depth=depth + 1,
                 )
-                # Outcome-sampling regret update (importance-weighted) for the sampled action only
-                # Estimate node utility with the sampled outcome as a plug-in estimator
-                node_utility = u
-                p_s = max(1e-12, strategy[idx])
-                k = action_key(a)
-                node.regret_sum[k] = node.regret_sum.get(k, 0.0) + (reach_prob_other / p_s) * (u - node_utility)
-                return node_utility
+                gs.undo(rec)
+                action_utils.append(u)
+            node_utility = sum(p * u for p, u in zip(strategy, action_utils) if u is not None)
+            # Update regrets for all expanded actions
+            regret_sum = node.regret_sum
+            for i, u in enumerate(action_utils):
+                if u is not None:
+                    regret_sum[i] += reach_prob_other * (u - node_utility)
+                    if self.cfr_plus and regret_sum[i] < 0.0:
+                        regret_sum[i] = 0.0
+            node.dirty = True
+            if self.regret_pruning:
+                self._schedule_pruning(node)
+            return node_utility
         else:
             # Opponent node: compute their current strategy and update their average with their reach
-            strategy = node.get_strategy(legal, realization_weight=reach_prob_other)
-            idx = self._sample_from_dist(strategy) if legal else 0
-            a = legal[idx]
-            gs_next = self._clone_and_apply(gs, a)
+            avg_weight = self.iteration if self.cfr_plus else 1
+            strategy = node.get_strategy(legal, realization_weight=reach_prob_other * avg_weight)
+            idx = node.sample(self.rng.random()) if legal else 0
+            rec = gs.apply_reversible(legal[idx])
             # Recurse, updating opponent reach prob and keeping updating player's reach
-            return self._mccfr_traverse(
-                gs_next,
+            u = self._mccfr_traverse(
+                gs,
                 updating_player,
                 reach_prob_other=reach_prob_other * strategy[idx],
                 reach_prob_updating=reach_prob_updating,
                 depth=depth + 1,
             )
-
-    def _clone_and_apply(self, gs: GameState, a: Action) -> GameState:
-        # Use engine-provided clone to preserve internal state safely
-        gs2: GameState = gs.clone()
-        gs2.apply(a)
-        return gs2
-
-    def _sample_from_dist(self, dist: List[float]) -> int:
-        r = self.rng.random()
-        c = 0.0
-        for i, p in enumerate(dist):
-            c += p
-            if r <= c:
-                return i
-        return len(dist) - 1
+            gs.undo(rec)
+            return u
 
     def action_probabilities(self, gs: GameState) -> List[Tuple[Action, float]]:
-        legal = gs.legal_actions()
         current = gs.current_player
         key = infoset_key(gs, current)
-        node = self.nodes.setdefault(key, NodeStats())
+        legal = self._legal_cache.get(key)
+        if legal is None:
+            legal = self._legal_cache[key] = gs.legal_actions()
+        node = self.nodes.get(key)
+        if node is None:
+            node = self.nodes[key] = NodeStats(len(legal))
         # Prefer average strategy if available; fall back to current strategy
         avg = node.get_average_strategy(legal)
         strategy = avg if avg and sum(avg) > 0 else node.get_strategy(legal, realization_weight=0.0)
         return list(zip(legal, strategy))
 
     def save_checkpoint(self, path: str) -> None:
-        data = {
-            "nodes": {
-                k: {
-                    "regret_sum": v.regret_sum,
-                    "strategy_sum": v.strategy_sum,
-                }
-                for k, v in self.nodes.items()
-            },
-            "config": {
-                "max_depth": self.max_depth,
-                "traversal_mode": self.traversal_mode,
-            },
-        }
+        # Binary unless the path ends in .json; binary keeps infoset keys as plain ints and
+        # floats unformatted, so it is much smaller and faster to write/read.
         import json
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f)
+        config = {
+            "max_depth": self.max_depth,
+            "traversal_mode": self.traversal_mode,
+        }
+        if path.endswith(".json"):
+            data = {
+                "nodes": {
+                    f"{k:016x}": {
+                        "regret_sum": v.regret_sum,
+                        "strategy_sum": v.strategy_sum,
+                    }
+                    for k, v in self.nodes.items()
+                },
+                "config": config,
+            }
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            return
+        # Stacked layout: keys and per-node action counts, plus every node's sums concatenated
+        # into one flat array('d') each, written as raw little-endian buffers after the header
+        import struct
+        import sys
+        nodes = self.nodes.values()
+        arrays = (
+            array("Q", self.nodes.keys()),
+            array("H", [len(v.regret_sum) for v in nodes]),
+            array("d", chain.from_iterable(v.regret_sum for v in nodes)),
+            array("d", chain.from_iterable(v.strategy_sum for v in nodes)),
+        )
+        if sys.byteorder != "little":
+            for arr in arrays:
+                arr.byteswap()
+        header = json.dumps({
+            "version": _CKPT_VERSION,
+            "nodes": len(arrays[0]),
+            "actions": len(arrays[2]),
+            "config": config,
+        }).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(_CKPT_MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            for arr in arrays:
+                arr.tofile(f)
 
     def load_checkpoint(self, path: str) -> None:
         import json
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        nodes = data.get("nodes", {})
         self.nodes = {}
-        for k, v in nodes.items():
+        if path.endswith(".json"):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            nodes = data.get("nodes", {})
+            for k, v in nodes.items():
+                if isinstance(v.get("regret_sum"), dict) or not _is_hex_key(k):
+                    # Pre-int-key checkpoints: string infoset keys and per-action dict sums,
+                    # which cannot be mapped onto the current keys; retrain instead
+                    raise ValueError(f"{path}: unsupported legacy checkpoint format")
+                ns = NodeStats()
+                ns.regret_sum = [float(x) for x in v.get("regret_sum", [])]
+                ns.strategy_sum = [float(x) for x in v.get("strategy_sum", [])]
+                ns.strategy_total = sum(ns.strategy_sum)
+                self.nodes[int(k, 16)] = ns
+            return
+        # Plain buffers only: nothing in the file is executed or unpickled
+        import struct
+        import sys
+        with open(path, "rb") as f:
+            if f.read(len(_CKPT_MAGIC)) != _CKPT_MAGIC:
+                raise ValueError(f"{path}: not a coup_gto binary checkpoint")
+            (header_len,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(header_len))
+            if header.get("version") != _CKPT_VERSION:
+                raise ValueError(f"{path}: unsupported checkpoint version {header.get('version')!r}")
+            keys, sizes, regret_arr, strategy_arr = array("Q"), array("H"), array("d"), array("d")
+            keys.fromfile(f, header["nodes"])
+            sizes.fromfile(f, header["nodes"])
+            regret_arr.fromfile(f, header["actions"])
+            strategy_arr.fromfile(f, header["actions"])
+        if sys.byteorder != "little":
+            for arr in (keys, sizes, regret_arr, strategy_arr):
+                arr.byteswap()
+        if sum(sizes) != len(regret_arr):
+            raise ValueError(f"{path}: corrupt checkpoint (action counts do not match the sums)")
+        regret_sum = regret_arr.tolist()
+        strategy_sum = strategy_arr.tolist()
+        pos = 0
+        for k, n in zip(keys, sizes):
             ns = NodeStats()
-            ns.regret_sum = {kk: float(vv) for kk, vv in v.get("regret_sum", {}).items()}
-            ns.strategy_sum = {kk: float(vv) for kk, vv in v.get("strategy_sum", {}).items()}
+            ns.regret_sum = regret_sum[pos:pos + n]
+            ns.strategy_sum = strategy_sum[pos:pos + n]
+            ns.strategy_total = sum(ns.strategy_sum)
             self.nodes[k] = ns
+            pos += n
 
     def evaluate(self, episodes: int = 100, seed: Optional[int] = None) -> float:
-        # Self-play using average strategies; return avg utility for player 0
+        # Self-play using average strategies; return avg utility for player 0.
+        # Average strategies do not change while evaluating, so each infoset's legal tuple and
+        # cumulative average strategy are built once and shared by every episode.
         rng = random.Random(seed)
+        draw = self.rng.random
+        legal_cache = self._legal_cache
+        policy: Dict[int, List[float]] = {}
         total = 0.0
         for _ in range(episodes):
-            gs = GameState(num_players=2, seed=rng.randrange(1 << 30))
+            gs = GameState(num_players=2, seed=rng.randrange(1 << 30), rules=self.rules)
             steps = 0
             while gs.winner() is None and steps < self.max_depth:
-                acts = self.action_probabilities(gs)
-                if not acts:
+                key = infoset_key(gs, gs.current_player)
+                legal = legal_cache.get(key)
+                if legal is None:
+                    legal = legal_cache[key] = gs.legal_actions()
+                if not legal:
                     break
-                actions, probs = zip(*acts)
-                idx = self._sample_from_dist(list(probs))
-                gs.apply(actions[idx])
+                cum = policy.get(key)
+                if cum is None:
+                    node = self.nodes.get(key) or NodeStats(len(legal))
+                    cum = policy[key] = list(accumulate(node.get_average_strategy(legal)))
+                # Inverse-CDF sample, clamped in case rounding leaves the total below the draw
+                gs.apply_unchecked(legal[min(bisect_left(cum, draw()), len(cum) - 1)])
                 steps += 1
             w = gs.winner()
             total += 1.0 if w == 0 else -1.0
         return total / max(1, episodes)
+
+
+def _is_hex_key(k: str) -> bool:
+    try:
+        int(k, 16)
+    except ValueError:
+        return False
+    return True
+
+
+def _run_shard(
+    nodes: Dict[int, NodeStats],
+    seed: int,
+    max_depth: int,
+    traversal_mode: str,
+    cfr_plus: bool,
+    iteration: int,
+    iterations: int,
+    game_seed: Optional[int],
+) -> Dict[int, Tuple[List[float], List[float]]]:
+    # Worker entry point for MCCFRSolver.iterate_parallel; `nodes` arrives as a private copy
+    base = {k: (list(v.regret_sum), list(v.strategy_sum)) for k, v in nodes.items()}
+    solver = MCCFRSolver(
+        seed=seed,
+        max_depth=max_depth,
+        traversal_mode=traversal_mode,
+        cfr_plus=cfr_plus,
+    )
+    solver.nodes = nodes
+    solver.iteration = iteration
+    solver.iterate(iterations, game_seed=game_seed)
+    deltas = {}
+    for k, v in solver.nodes.items():
+        r0, s0 = base.get(k) or ([0.0] * len(v.regret_sum), [0.0] * len(v.strategy_sum))
+        deltas[k] = (
+            [x - x0 for x, x0 in zip(v.regret_sum, r0)],
+            [x - x0 for x, x0 in zip(v.strategy_sum, s0)],
+        )
+    return deltas
@@ -0,0 +1,21 @@
+import pytest
+
+from coup_gto.solver import MCCFRSolver
+
+
+# Session-scoped so the solvers are trained once. evaluate() advances the solver RNG and
+# action_probabilities() inserts nodes, so consumers work on a copy.deepcopy of them.
+@pytest.fixture(scope="session")
+def trained_solver() -> MCCFRSolver:
+    # Debug stays on so the trace path is exercised
+    solver = MCCFRSolver(seed=123, max_depth=60, debug=True)
+    solver.iterate(iterations=1, game_seed=42)
+    return solver
+
+
+@pytest.fixture(scope="session")
+def full_solver() -> MCCFRSolver:
+    # Very small full-branch run to ensure that mode works end to end
+    solver = MCCFRSolver(seed=1, max_depth=15, traversal_mode="full", debug=False)
+    solver.iterate(iterations=1, game_seed=5)
+    return solver
@@ -0,0 +1,54 @@
+from typing import Dict
+
+from coup_gto.engine import Action, ActionType, GameState, Role
+
+
+def _take_from_deck(deck: list, idx: int) -> Role:
+    # Swap-pop: deck order below the top is irrelevant to these setups
+    role = deck[idx]
+    deck[idx] = deck[-1]
+    deck.pop()
+    return role
+
+
+def ensure_role_in_hand(gs: GameState, pid: int, role: Role):
+    ps = gs.players[pid]
+    if ps.has(role):
+        return
+    hand = ps.hand
+    # Take it from the deck if available, else swap with the opponent
+    try:
+        idx = gs.deck.index(role)
+    except ValueError:
+        pass
+    else:
+        hand[0] = _take_from_deck(gs.deck, idx)
+        return
+    opp = gs.players[pid ^ 1]
+    if opp.has(role):
+        opp_hand = opp.hand
+        i = opp_hand.index(role)
+        opp_hand[i], hand[0] = hand[0], opp_hand[i]
+
+
+def remove_role_from_hand(gs: GameState, pid: int, role: Role):
+    ps = gs.players[pid]
+    if not ps.has(role):
+        return
+    hand = ps.hand
+    idx = hand.index(role)
+    # Replace with a different role from the deck if possible, else swap with the opponent
+    non_role = next((r for r in gs.deck if r != role), None)
+    if non_role is not None:
+        hand[idx] = _take_from_deck(gs.deck, gs.deck.index(non_role))
+        return
+    opp_hand = gs.players[pid ^ 1].hand
+    for i, r in enumerate(opp_hand):
+        if r != role:
+            opp_hand[i], hand[idx] = hand[idx], opp_hand[i]
+            return
+
+
+def actions_by_type(gs: GameState) -> Dict[ActionType, Action]:
+    # One legal action per type is all a 2-player state offers (targets are implied)
+    return {a.type: a for a in gs.legal_actions()}
@@ -1,6 +1,6 @@
-import pytest
+from coup_gto.engine import GameState, ActionType, Action, Role, action_str, decode_action, encode_action
 
-from coup_gto.engine import GameState, ActionType, Action
+from helpers import actions_by_type
 
 
 def test_setup_two_players_deterministic_seed():
@@ -20,21 +20,18 @@ def test_setup_two_players_deterministic_seed():
 
 def test_legal_actions_basic():
     gs = GameState(num_players=2, seed=1)
-    acts = gs.legal_actions()
-    kinds = {a.type for a in acts}
-    assert ActionType.INCOME in kinds
-    assert ActionType.FOREIGN_AID in kinds
+    acts = actions_by_type(gs)
+    assert ActionType.INCOME in acts
+    assert ActionType.FOREIGN_AID in acts
     # Coup should not be legal at 2 coins
-    assert ActionType.COUP not in kinds
+    assert ActionType.COUP not in acts
 
 
 def test_coup_becomes_legal_at_7():
     gs = GameState(num_players=2, seed=2)
     gs.players[0].coins = 7
     acts = gs.legal_actions()
-    kinds = {a.type for a in acts}
-    assert ActionType.COUP in kinds
-    # Has a target and is unique among actions
+    # Legal, has a target and is unique among actions
     coup_actions = [a for a in acts if a.type == ActionType.COUP]
     assert len(coup_actions) == 1
     assert coup_actions[0].target == 1
@@ -63,15 +60,99 @@ def test_apply_coup_resolves_and_reveals_one_card():
     gs.players[0].coins = 7
     # Ensure coup is legal then apply
     acts = gs.legal_actions()
-    coup = [a for a in acts if a.type == ActionType.COUP][0]
+    coup = next(a for a in acts if a.type == ActionType.COUP)
     # Track P1 before
-    p1_hand_before = list(gs.players[1].hand)
+    p1_hand_before = len(gs.players[1].hand)
     gs.apply(coup)
     # Actor pays 7
     assert gs.players[0].coins == 0
     # Target loses exactly one card, moved to revealed
-    assert len(gs.players[1].hand) == len(p1_hand_before) - 1
+    assert len(gs.players[1].hand) == p1_hand_before - 1
     assert len(gs.players[1].revealed) == 1
     # Next player is P1 if still alive
     assert gs.current_player == 1
 
+
+def test_action_packed_encoding_roundtrip():
+    for a in (
+        Action(actor=0, type=ActionType.INCOME),
+        Action(actor=1, type=ActionType.STEAL, target=0),
+        Action(actor=5, type=ActionType.ASSASSINATE, target=0, cost=3),
+    ):
+        code = encode_action(a.actor, a.type, a.target, a.cost)
+        assert decode_action(code) == a
+        assert action_str(code) == str(a)
+    # Codes of legal actions decode back to the very instances legal_actions() returns
+    gs = GameState(num_players=2, seed=1)
+    for a in gs.legal_actions():
+        assert decode_action(encode_action(*a)) is a
+
+
+def test_snapshot_restore_roundtrip():
+    gs = GameState(num_players=2, seed=6)
+    snap = gs.snapshot()
+    before = gs.clone()
+    # Play a few plies including a shuffle-triggering challenge path
+    for _ in range(6):
+        legal = gs.legal_actions()
+        if not legal:
+            break
+        gs.apply(legal[-1])
+    gs.restore(snap)
+    assert gs.players == before.players
+    assert gs.deck == before.deck
+    assert gs.current_player == before.current_player
+    assert gs.pending_action is None
+    assert gs.rng.getstate() == before.rng.getstate()
+
+
+def test_apply_reversible_undo_restores_state():
+    gs = GameState(num_players=2, seed=19)
+    before = gs.clone()
+    records = []
+    # Walk a line that exercises challenges (deck shuffles) and influence loss
+    for step in range(12):
+        legal = gs.legal_actions()
+        if not legal:
+            break
+        records.append(gs.apply_reversible(legal[step % len(legal)]))
+    for rec in reversed(records):
+        gs.undo(rec)
+    assert gs.players == before.players
+    assert gs.deck == before.deck
+    assert gs.current_player == before.current_player
+    assert gs.pending_action is None
+    assert gs.rng.getstate() == before.rng.getstate()
+
+
+def test_zobrist_tracks_state():
+    gs = GameState(num_players=2, seed=8)
+    key = gs.zobrist()
+    assert gs.clone().zobrist() == key
+    assert GameState(num_players=2, seed=8).zobrist() == key
+    rec = gs.apply_reversible(gs.legal_actions()[0])
+    assert gs.zobrist() != key
+    gs.undo(rec)
+    assert gs.zobrist() == key
+
+
+def test_game_state_has_interaction_fields():
+    # Guards against a second, simpler GameState definition shadowing the full one
+    for name in ("pending_action", "pending_blocker", "awaiting_response_from", "pending_claim_role"):
+        assert hasattr(GameState, name)
+
+
+def test_action_ids_dense_per_type_and_target():
+    from coup_gto.engine.actions import ACTION_IDS, NUM_ACTION_IDS
+    from coup_gto.solver import action_key
+
+    assert sorted(ACTION_IDS.values()) == list(range(NUM_ACTION_IDS))
+    assert action_key(Action(actor=0, type=ActionType.STEAL, target=1)) == action_key(Action(actor=1, type=ActionType.STEAL, target=1))
+
+
+def test_enum_members_print_their_names():
+    assert str(Role.DUKE) == "Duke"
+    assert f"{Role.AMBASSADOR:>12}" == "  Ambassador"
+    assert str(ActionType.STEAL) == "STEAL"
+    assert f"{ActionType.BLOCK_FOREIGN_AID}" == "BLOCK_FOREIGN_AID"
+    assert str(Action(actor=1, type=ActionType.STEAL, target=0)) == "P1:STEAL->P0"
@@ -0,0 +1,16 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from coup_gto.solver import MCCFRSolver
+
+# Same group as test_mccfr.py so timings are not taken next to the engine tests
+pytestmark = pytest.mark.xdist_group(name="mccfr")
+
+
+def test_mccfr_iterate_perf(benchmark):
+    # Fresh solver per round so every timing covers the same single iteration
+    def run():
+        MCCFRSolver(seed=123, max_depth=60).iterate(iterations=1, game_seed=42)
+
+    benchmark(run)
@@ -1,75 +1,57 @@
-from coup_gto.engine import GameState, ActionType, Action, Role
+import pytest
+
+from coup_gto.engine import GameState, ActionType, Role
+
+from helpers import actions_by_type, ensure_role_in_hand, remove_role_from_hand
+
+TAX = ActionType.TAX
+PASS = ActionType.PASS
+CHALLENGE = ActionType.CHALLENGE
 
 
 def test_tax_pass_succeeds():
     gs = GameState(num_players=2, seed=10)
-    p0 = 0
+    p0 = gs.players[0]
     # P0 chooses TAX
-    tax = [a for a in gs.legal_actions() if a.type == ActionType.TAX][0]
-    coins_before = gs.players[p0].coins
+    tax = next(a for a in gs.legal_actions() if a.type == TAX)
+    coins_before = p0.coins
     gs.apply(tax)
     # P1 can CHALLENGE or PASS
-    resp = gs.legal_actions()
-    kinds = {a.type for a in resp}
-    assert ActionType.CHALLENGE in kinds and ActionType.PASS in kinds
+    acts = actions_by_type(gs)
+    assert CHALLENGE in acts and PASS in acts
     # Choose PASS -> TAX succeeds
-    p1_pass = [a for a in resp if a.type == ActionType.PASS][0]
+    p1_pass = acts[PASS]
     gs.apply(p1_pass)
-    assert gs.players[p0].coins == coins_before + 3
-    assert gs.pending_action is None
-    assert gs.current_player == 1
-
-
-def test_tax_challenge_actor_truthful():
-    gs = GameState(num_players=2, seed=11)
-    # Ensure P0 has a Duke
-    if Role.DUKE not in gs.players[0].hand:
-        # Swap from deck
-        for i, r in enumerate(gs.deck):
-            if r == Role.DUKE:
-                gs.deck.pop(i)
-                gs.players[0].hand[0] = Role.DUKE
-                break
-    # P0 claims TAX
-    tax = [a for a in gs.legal_actions() if a.type == ActionType.TAX][0]
-    p0_coins_before = gs.players[0].coins
-    p1_hand_before = len(gs.players[1].hand)
-    gs.apply(tax)
-    # P1 challenges
-    chal = [a for a in gs.legal_actions() if a.type == ActionType.CHALLENGE][0]
-    gs.apply(chal)
-    # Actor truthful: P1 loses one influence, P0 gains +3
-    assert len(gs.players[1].hand) == p1_hand_before - 1
-    assert gs.players[0].coins == p0_coins_before + 3
+    assert p0.coins == coins_before + 3
     assert gs.pending_action is None
     assert gs.current_player == 1
 
 
-def test_tax_challenge_actor_bluff():
-    gs = GameState(num_players=2, seed=12)
-    # Ensure P0 does NOT have a Duke
-    if Role.DUKE in gs.players[0].hand:
-        # Replace with a non-Duke from deck
-        replacement = None
-        for i, r in enumerate(gs.deck):
-            if r != Role.DUKE:
-                replacement = r
-                gs.deck.pop(i)
-                break
-        for j, r in enumerate(gs.players[0].hand):
-            if r == Role.DUKE:
-                gs.players[0].hand[j] = replacement
-                break
+@pytest.mark.parametrize("truthful,seed", [(True, 11), (False, 12)])
+def test_tax_challenge_actor(truthful, seed):
+    gs = GameState(num_players=2, seed=seed)
+    p0, p1 = gs.players
+    # Ensure P0 does (or does NOT) have a Duke
+    if truthful:
+        ensure_role_in_hand(gs, 0, Role.DUKE)
+    else:
+        remove_role_from_hand(gs, 0, Role.DUKE)
     # P0 claims TAX
-    tax = [a for a in gs.legal_actions() if a.type == ActionType.TAX][0]
-    p0_coins_before = gs.players[0].coins
-    p0_hand_before = len(gs.players[0].hand)
+    tax = next(a for a in gs.legal_actions() if a.type == TAX)
+    p0_coins_before = p0.coins
+    p0_hand_before = len(p0.hand)
+    p1_hand_before = len(p1.hand)
     gs.apply(tax)
     # P1 challenges
-    chal = [a for a in gs.legal_actions() if a.type == ActionType.CHALLENGE][0]
+    chal = next(a for a in gs.legal_actions() if a.type == CHALLENGE)
     gs.apply(chal)
-    # Actor bluffed: P0 loses one influence, no coins gained
-    assert len(gs.players[0].hand) == p0_hand_before - 1
-    assert gs.players[0].coins == p0_coins_before
+    if truthful:
+        # Actor truthful: P1 loses one influence, P0 gains +3
+        assert len(p1.hand) == p1_hand_before - 1
+        assert p0.coins == p0_coins_before + 3
+    else:
+        # Actor bluffed: P0 loses one influence, no coins gained
+        assert len(p0.hand) == p0_hand_before - 1
+        assert p0.coins == p0_coins_before
     assert gs.pending_action is None
     assert gs.current_player == 1